@@ -6,15 +6,9 @@ via the Dot. App API.
 Note: This is a community-maintained client library, not the official Quote0 API.
 """
 
-from .client import Quote0Client
-from .models import (
-    Device,
-    DeviceStatus,
-    Task,
-    TextContentRequest,
-    ImageContentRequest,
-    APIResponse,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .exceptions import (
     Quote0Error,
     AuthenticationError,
@@ -26,8 +20,52 @@ from .exceptions import (
 
 __version__ = "0.1.1"
 
+# Clients and models pull in httpx and pydantic, so they are imported on
+# first attribute access (PEP 562) rather than on ``import quote0_client``
+_LAZY_IMPORTS = {
+    "Quote0Client": ".client",
+    "AsyncQuote0Client": ".async_client",
+    "BatterySnapshot": ".models",
+    "Device": ".models",
+    "DeviceStatus": ".models",
+    "Task": ".models",
+    "TextContentRequest": ".models",
+    "ImageContentRequest": ".models",
+    "APIResponse": ".models",
+}
+
+if TYPE_CHECKING:
+    from .client import Quote0Client
+    from .async_client import AsyncQuote0Client
+    from .models import (
+        BatterySnapshot,
+        Device,
+        DeviceStatus,
+        Task,
+        TextContentRequest,
+        ImageContentRequest,
+        APIResponse,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import clients and models on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(__all__)
+
+
 __all__ = [
     "Quote0Client",
+    "AsyncQuote0Client",
+    "BatterySnapshot",
     "Device",
     "DeviceStatus",
     "Task",
@@ -0,0 +1,409 @@
+"""Shared plumbing for the Quote0 SDK clients.
+
+This module holds the logic that does not depend on whether HTTP calls are
+made synchronously or asynchronously: argument validation, HTTP client
+configuration and mapping of HTTP status codes to SDK exceptions. Both
+``Quote0Client`` and ``AsyncQuote0Client`` inherit from ``BaseClient``.
+"""
+
+import httpx
+import os
+import random
+import re
+import time
+from functools import lru_cache
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type, Union
+
+from .models import (
+    APIResponse,
+    BatteryStatus,
+    BatterySnapshot,
+    CurrentRenderInfo,
+    Device,
+    DeviceStatus,
+    NextRenderTime,
+    RenderInfo,
+    Task,
+)
+from .exceptions import (
+    Quote0Error,
+    AuthenticationError,
+    NotFoundError,
+    PermissionError,
+    ValidationError,
+    RateLimitError,
+)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_type: type) -> TypeAdapter:
+    """Return a TypeAdapter validating a whole response list in one call.
+
+    Validated responses are decoded with ``validate_json``, which parses
+    the raw body and builds the models in a single pydantic-core pass
+    without intermediate Python dicts.
+
+    Adapters are built on first use so that importing the SDK does not
+    build any validators (the models use ``defer_build``).
+    """
+    return TypeAdapter(List[item_type])
+
+
+class BaseClient:
+    """Common base class for the synchronous and asynchronous clients.
+
+    Attributes:
+        api_key: API key for authentication
+        base_url: Base URL of the API endpoint
+        max_retries: Number of retries for rate-limited (429) requests
+        backoff_base: Initial retry delay in seconds
+        validate_responses: Whether responses are validated by pydantic
+        reuse_tasks: Whether unchanged task lists skip re-parsing
+        _devices_cache: Last device list with its fetch time (monotonic ms)
+        _status_cache: Last status per device id with its fetch time
+        _tasks_cache: Last raw task list body and parsed tasks per
+            (device id, task type)
+    """
+
+    BASE_URL = "https://dot.mindreset.tech"
+
+    # Accepted device serial numbers; override on a subclass if yours differ
+    DEVICE_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{6,64}")
+
+    # API endpoint paths, formatted with the device id (and task type)
+    _DEVICES_PATH = "/api/authV2/open/devices"
+    _STATUS_PATH = "/api/authV2/open/device/{}/status"
+    _NEXT_PATH = "/api/authV2/open/device/{}/next"
+    _TASKS_PATH = "/api/authV2/open/device/{}/{}/list"
+    _TEXT_PATH = "/api/authV2/open/device/{}/text"
+    _IMAGE_PATH = "/api/authV2/open/device/{}/image"
+
+    # Client-error status codes and the exception raised for each
+    _STATUS_MAP: Dict[int, Tuple[Type[Quote0Error], str]] = {
+        400: (ValidationError, "Request validation failed"),
+        401: (AuthenticationError, "Invalid API key or authentication failed"),
+        403: (PermissionError, "Insufficient permissions to access this resource"),
+        404: (NotFoundError, "Device or resource not found"),
+        429: (RateLimitError, "Rate limit exceeded. Please reduce request frequency."),
+    }
+
+    # Task types accepted by list_tasks; extend on a subclass as the API grows
+    _VALID_TASK_TYPES: FrozenSet[str] = frozenset({"loop"})
+
+    # Longest pause (seconds) a rate-limited request waits before retrying;
+    # a longer Retry-After from the server raises RateLimitError instead
+    MAX_RETRY_DELAY = 2.0
+
+    # Upper bound on in-flight requests for batch helpers (API allows 10 req/s)
+    MAX_CONCURRENCY = 10
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.1,
+        validate_responses: bool = True,
+        reuse_tasks: bool = False,
+    ):
+        """Validate and store the connection settings.
+
+        Args:
+            api_key: API key from Dot. App
+            base_url: Optional base URL (default: https://dot.mindreset.tech)
+            max_retries: How often a rate-limited (429) request is retried
+            backoff_base: Initial retry delay in seconds, doubled per attempt
+            validate_responses: If False, response models are built with
+                model_construct and skip validation
+            reuse_tasks: If True, list_tasks keeps the last body per device
+                and task type and, while it is unchanged, returns copies of
+                the tasks parsed from it instead of parsing it again
+
+        Raises:
+            ValueError: If api_key is empty or max_retries is negative
+        """
+        if not api_key or not api_key.strip():
+            raise ValueError("api_key cannot be empty")
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+
+        self.api_key = api_key
+        self.base_url: str = base_url or self.BASE_URL
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.validate_responses = validate_responses
+        self.reuse_tasks = reuse_tasks
+        self._devices_cache: Optional[Tuple[float, List[Device]]] = None
+        self._status_cache: Dict[str, Tuple[float, DeviceStatus]] = {}
+        self._tasks_cache: Dict[Tuple[str, str], Tuple[bytes, List[Task]]] = {}
+
+    def _client_options(self) -> Dict:
+        """Build keyword arguments shared by httpx.Client and httpx.AsyncClient.
+
+        Returns:
+            Dictionary of options enabling HTTP/2, connection pooling,
+            compressed responses and the authentication headers sent with
+            every request
+        """
+        return {
+            "http2": True,
+            "trust_env": False,
+            "timeout": 30.0,
+            "headers": {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, br",
+            },
+            "limits": httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=60.0,
+            ),
+        }
+
+    def _retry_delay(self, attempt: int, response: httpx.Response) -> Optional[float]:
+        """Compute how long to wait before retrying a rate-limited request.
+
+        A numeric Retry-After header from the server wins; otherwise the
+        delay grows exponentially from backoff_base with a little jitter so
+        concurrent callers do not retry in lockstep. Delays never exceed
+        MAX_RETRY_DELAY.
+
+        Args:
+            attempt: Zero-based index of the attempt that was rate-limited
+            response: The 429 response
+
+        Returns:
+            Delay in seconds, or None if the server asks to wait longer than
+            MAX_RETRY_DELAY and the request should not be retried
+        """
+        try:
+            retry_after = max(float(response.headers.get("Retry-After")), 0.0)
+        except (TypeError, ValueError):
+            pass
+        else:
+            return retry_after if retry_after <= self.MAX_RETRY_DELAY else None
+        backoff = 2**attempt * self.backoff_base + random.random() * 0.05
+        return min(backoff, self.MAX_RETRY_DELAY)
+
+    def _check_device_id(self, device_id: str) -> None:
+        """Reject malformed device ids before making a request.
+
+        Args:
+            device_id: Device serial number
+
+        Raises:
+            ValidationError: If device_id does not match DEVICE_ID_PATTERN
+        """
+        if not isinstance(device_id, str) or not self.DEVICE_ID_PATTERN.fullmatch(
+            device_id
+        ):
+            raise ValidationError(f"Invalid device_id: {device_id!r}")
+
+    def _check_task_type(self, task_type: str) -> None:
+        """Reject task types the API does not support.
+
+        Args:
+            task_type: Task type passed to list_tasks
+
+        Raises:
+            ValidationError: If task_type is not in _VALID_TASK_TYPES
+        """
+        if task_type not in self._VALID_TASK_TYPES:
+            supported = ", ".join(repr(t) for t in sorted(self._VALID_TASK_TYPES))
+            raise ValidationError(
+                f"Invalid task_type: {task_type}. Only {supported} is currently supported."
+            )
+
+    @staticmethod
+    def _read_image(path: Union[str, os.PathLike]) -> bytes:
+        """Read an image file.
+
+        Args:
+            path: Path to the image file (PNG, 296px×152px)
+
+        Returns:
+            Raw file contents, for ImageContentRequest.from_png_bytes
+        """
+        with open(path, "rb") as f:
+            return f.read()
+
+    @staticmethod
+    def _parse_json(response: httpx.Response) -> Any:
+        """Decode a response body with pydantic-core's Rust JSON parser.
+
+        This works on the raw bytes and is several times faster than
+        ``response.json()``, which goes through the stdlib json module.
+
+        Args:
+            response: httpx.Response object with a JSON body
+
+        Returns:
+            Decoded JSON data (dict or list)
+        """
+        return from_json(response.content)
+
+    def _parse_devices(self, response: httpx.Response) -> List[Device]:
+        """Build Device models from a device list response."""
+        if self.validate_responses:
+            return _list_adapter(Device).validate_json(response.content)
+        return [Device.model_construct(**d) for d in self._parse_json(response)]
+
+    def _parse_status(self, response: httpx.Response) -> DeviceStatus:
+        """Build a DeviceStatus model from a device status response."""
+        if self.validate_responses:
+            return DeviceStatus.model_validate_json(response.content)
+        data = self._parse_json(response)
+        render = data["renderInfo"]
+        return DeviceStatus.model_construct(
+            deviceId=data["deviceId"],
+            alias=data.get("alias"),
+            location=data.get("location"),
+            status=BatteryStatus.model_construct(**data["status"]),
+            renderInfo=RenderInfo.model_construct(
+                last=render["last"],
+                current=CurrentRenderInfo.model_construct(**render["current"]),
+                next=NextRenderTime.model_construct(**render["next"]),
+            ),
+        )
+
+    def _parse_tasks(self, response: httpx.Response) -> List[Task]:
+        """Build Task models from a task list response."""
+        if self.validate_responses:
+            return _list_adapter(Task).validate_json(response.content)
+        return [Task.model_construct(**t) for t in self._parse_json(response)]
+
+    def _parse_tasks_reusing(
+        self, key: Tuple[str, str], response: httpx.Response
+    ) -> List[Task]:
+        """Parse a task list, copying the previous Task objects if unchanged.
+
+        Only active with reuse_tasks. Polling list_tasks usually returns the
+        same body again; comparing the raw bytes and shallow-copying the
+        cached tasks is far cheaper than parsing and validating them. The
+        cached tasks are never handed out, so a caller editing a returned
+        Task cannot change what the next poll returns.
+
+        Args:
+            key: (device_id, task_type) the response belongs to
+            response: httpx.Response of the task list endpoint
+
+        Returns:
+            New list of Task objects
+        """
+        if not self.reuse_tasks:
+            return self._parse_tasks(response)
+        cached = self._tasks_cache.get(key)
+        if cached is None or cached[0] != response.content:
+            cached = (response.content, self._parse_tasks(response))
+            self._tasks_cache[key] = cached
+        return [task.model_copy() for task in cached[1]]
+
+    def _parse_api_response(self, response: httpx.Response) -> APIResponse:
+        """Build an APIResponse model from a generic API response."""
+        if self.validate_responses:
+            return APIResponse.model_validate_json(response.content)
+        data = self._parse_json(response)
+        return APIResponse.model_construct(**{**data, "code": int(data["code"])})
+
+    def _parse_battery_snapshot(self, response: httpx.Response) -> BatterySnapshot:
+        """Extract battery and WiFi fields from a device status response.
+
+        Args:
+            response: httpx.Response of the device status endpoint
+
+        Returns:
+            BatterySnapshot built without pydantic validation
+
+        Raises:
+            Quote0Error: If the response lacks the expected fields
+        """
+        data = self._parse_json(response)
+        try:
+            status = data["status"]
+            return BatterySnapshot(data["deviceId"], status["battery"], status["wifi"])
+        except (KeyError, TypeError) as e:
+            raise Quote0Error(f"Malformed device status response: missing {e}") from e
+
+    def _cached_devices(self, ttl_ms: int) -> Optional[List[Device]]:
+        """Return the cached device list if it is younger than ttl_ms.
+
+        Args:
+            ttl_ms: Maximum age in milliseconds (0 disables the cache)
+
+        Returns:
+            Copy of the cached device list, or None on a cache miss
+        """
+        if ttl_ms <= 0 or self._devices_cache is None:
+            return None
+        fetched_at, devices = self._devices_cache
+        if time.monotonic() * 1000 - fetched_at < ttl_ms:
+            return list(devices)
+        return None
+
+    def _store_devices(self, devices: List[Device]) -> None:
+        """Remember a freshly fetched device list."""
+        self._devices_cache = (time.monotonic() * 1000, list(devices))
+
+    def _cached_status(self, device_id: str, ttl_ms: int) -> Optional[DeviceStatus]:
+        """Return the cached status of device_id if it is younger than ttl_ms.
+
+        Args:
+            device_id: Device serial number
+            ttl_ms: Maximum age in milliseconds (0 disables the cache)
+
+        Returns:
+            Cached DeviceStatus, or None on a cache miss
+        """
+        if ttl_ms <= 0:
+            return None
+        entry = self._status_cache.get(device_id)
+        if entry is not None and time.monotonic() * 1000 - entry[0] < ttl_ms:
+            return entry[1]
+        return None
+
+    def _store_status(self, device_id: str, status: DeviceStatus) -> None:
+        """Remember a freshly fetched device status.
+
+        The timestamp is taken after the response has been parsed, so the
+        entry's age never includes the request's own latency.
+        """
+        self._status_cache[device_id] = (time.monotonic() * 1000, status)
+
+    def _invalidate_status(self, device_id: str) -> None:
+        """Drop the cached status of a device whose content was changed."""
+        self._status_cache.pop(device_id, None)
+
+    def _handle_response(self, response: httpx.Response) -> None:
+        """Handle API response and raise appropriate exceptions.
+
+        This method maps HTTP status codes to appropriate exception types.
+
+        Args:
+            response: httpx.Response object to process
+
+        Raises:
+            AuthenticationError: On 401 Unauthorized
+            PermissionError: On 403 Forbidden
+            NotFoundError: On 404 Not Found
+            ValidationError: On 400 Bad Request
+            RateLimitError: On rate limit exceeded
+            Quote0Error: On 500 Server Error
+        """
+        status_code = response.status_code
+
+        if status_code == 200:
+            # Success
+            return
+
+        entry = self._STATUS_MAP.get(status_code)
+        if entry is not None:
+            exc_type, message = entry
+            raise exc_type(message)
+        if 500 <= status_code < 600:
+            # Server Error
+            raise Quote0Error(f"Server error: {status_code}")
+        # Unknown status code
+        raise Quote0Error(f"Unexpected status code: {status_code}")
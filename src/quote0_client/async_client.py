@@ -0,0 +1,529 @@
+"""Asynchronous Quote0 SDK Client for interacting with e-ink device API.
+
+This module provides an asyncio-based counterpart of ``Quote0Client``. Every
+API operation is a coroutine, so requests for several devices can be issued
+concurrently (e.g. with ``asyncio.gather``) instead of one after another.
+"""
+
+import asyncio
+import httpx
+import os
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Any,
+    Literal,
+    Optional,
+    Union,
+    overload,
+)
+
+from .models import (
+    BatterySnapshot,
+    Device,
+    DeviceStatus,
+    Task,
+    TextContentRequest,
+    ImageContentRequest,
+    APIResponse,
+)
+from ._base import BaseClient
+
+
+class AsyncQuote0Client(BaseClient):
+    """Asynchronous client for interacting with Quote0 e-ink device API.
+
+    This class mirrors ``Quote0Client`` method-for-method, but all API
+    operations must be awaited.
+
+    Attributes:
+        api_key: API key for authentication
+        base_url: Base URL of the API endpoint
+        _client: Internal asynchronous HTTP client instance
+
+    Example:
+        >>> async with AsyncQuote0Client(api_key="your-api-key") as client:
+        ...     devices = await client.get_devices()
+        ...     statuses = await asyncio.gather(
+        ...         *(client.get_device_status(d.id) for d in devices)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.1,
+        validate_responses: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        reuse_tasks: bool = False,
+    ):
+        """Initialize client with API key.
+
+        Args:
+            api_key: API key from Dot. App
+            base_url: Optional base URL (default: https://dot.mindreset.tech)
+            max_retries: How often a rate-limited (429) request is retried
+                (default: 3, 0 disables retries)
+            backoff_base: Initial retry delay in seconds (default: 0.1)
+            validate_responses: Validate API responses with pydantic (default:
+                True); False builds models without validation, which is
+                faster but trusts the server to send well-formed data
+            transport: Optional httpx async transport to use instead of the
+                default connection pool (e.g. httpx.MockTransport in tests)
+            reuse_tasks: Skip re-parsing a device's task list while it is
+                unchanged, returning copies of the cached tasks (default: False)
+
+        Raises:
+            ValueError: If api_key is empty or max_retries is negative
+        """
+        super().__init__(
+            api_key,
+            base_url,
+            max_retries,
+            backoff_base,
+            validate_responses,
+            reuse_tasks,
+        )
+        self._client = httpx.AsyncClient(transport=transport, **self._client_options())
+
+    async def get_devices(self, ttl_ms: int = 0) -> List[Device]:
+        """Get list of all registered devices.
+
+        Args:
+            ttl_ms: Return the previously fetched list if it is younger than
+                this many milliseconds (default: 0, always fetch)
+
+        Returns:
+            List of Device objects representing all registered devices
+
+        Example:
+            >>> devices = await client.get_devices()
+            >>> print(f"Found {len(devices)} devices")
+        """
+        cached = self._cached_devices(ttl_ms)
+        if cached is not None:
+            return cached
+
+        response = await self._request("GET", self.base_url + self._DEVICES_PATH)
+        devices = self._parse_devices(response)
+        self._store_devices(devices)
+        return devices
+
+    async def get_device_status(self, device_id: str, ttl_ms: int = 0) -> DeviceStatus:
+        """Get the current status of a specific device.
+
+        Args:
+            device_id: Device serial number
+            ttl_ms: Return the previously fetched status if it is younger than
+                this many milliseconds (default: 0, always fetch)
+
+        Returns:
+            DeviceStatus object containing device information, battery status,
+            WiFi status, and rendering information
+
+        Raises:
+            NotFoundError: If device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+            ValidationError: If device_id is malformed
+
+        Example:
+            >>> status = await client.get_device_status("abc123")
+            >>> print(f"Battery: {status.status.battery}")
+        """
+        self._check_device_id(device_id)
+        cached = self._cached_status(device_id, ttl_ms)
+        if cached is not None:
+            return cached
+
+        response = await self._request(
+            "GET", self.base_url + self._STATUS_PATH.format(device_id)
+        )
+        status = self._parse_status(response)
+        self._store_status(device_id, status)
+        return status
+
+    async def get_device_status_minimal(self, device_id: str) -> BatterySnapshot:
+        """Get only the battery and WiFi status of a device.
+
+        Reads the two fields straight from the decoded JSON without building
+        the full DeviceStatus model, which makes it cheap for monitoring loops.
+
+        Args:
+            device_id: Device serial number
+
+        Returns:
+            BatterySnapshot with device_id, battery and wifi
+
+        Raises:
+            NotFoundError: If device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+            ValidationError: If device_id is malformed
+
+        Example:
+            >>> snapshot = await client.get_device_status_minimal("abc123")
+            >>> print(f"{snapshot.battery} / {snapshot.wifi}")
+        """
+        self._check_device_id(device_id)
+        response = await self._request(
+            "GET", self.base_url + self._STATUS_PATH.format(device_id)
+        )
+        return self._parse_battery_snapshot(response)
+
+    def prepare_status_poller(
+        self, device_id: str
+    ) -> Callable[[], Awaitable[DeviceStatus]]:
+        """Build a coroutine function that fetches one device's status repeatedly.
+
+        The HTTP request is built once up front and re-sent on every call.
+
+        Args:
+            device_id: Device serial number
+
+        Returns:
+            Zero-argument coroutine function returning a fresh DeviceStatus
+
+        Example:
+            >>> poll = client.prepare_status_poller("abc123")
+            >>> status = await poll()
+        """
+        self._check_device_id(device_id)
+        request = self._client.build_request(
+            "GET", self.base_url + self._STATUS_PATH.format(device_id)
+        )
+
+        async def poll() -> DeviceStatus:
+            response = await self._send(lambda: self._client.send(request))
+            status = self._parse_status(response)
+            self._store_status(device_id, status)
+            return status
+
+        return poll
+
+    async def get_device_statuses(self, device_ids: List[str]) -> List[DeviceStatus]:
+        """Get the current status of several devices concurrently.
+
+        At most ``MAX_CONCURRENCY`` requests are in flight at a time.
+
+        Args:
+            device_ids: Device serial numbers
+
+        Returns:
+            List of DeviceStatus objects in the same order as device_ids
+
+        Raises:
+            NotFoundError: If any device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+
+        Example:
+            >>> statuses = await client.get_device_statuses(["abc123", "def456"])
+        """
+        for device_id in device_ids:
+            self._check_device_id(device_id)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def fetch(device_id: str) -> DeviceStatus:
+            async with semaphore:
+                return await self.get_device_status(device_id)
+
+        return list(await asyncio.gather(*(fetch(d) for d in device_ids)))
+
+    @overload
+    async def switch_to_next(
+        self, device_id: str, parse_response: Literal[True] = ...
+    ) -> APIResponse: ...
+
+    @overload
+    async def switch_to_next(
+        self, device_id: str, parse_response: Literal[False]
+    ) -> None: ...
+
+    @overload
+    async def switch_to_next(
+        self, device_id: str, parse_response: bool = ...
+    ) -> Optional[APIResponse]: ...
+
+    async def switch_to_next(
+        self, device_id: str, parse_response: bool = True
+    ) -> Optional[APIResponse]:
+        """Switch device to the next content.
+
+        Args:
+            device_id: Device serial number
+            parse_response: Set to False for fire-and-forget calls; the body
+                is then discarded undecoded and None is returned
+
+        Returns:
+            APIResponse object with the response data, or None if
+            parse_response is False
+
+        Raises:
+            NotFoundError: If device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+            ValidationError: If device_id is malformed
+
+        Example:
+            >>> response = await client.switch_to_next("abc123")
+            >>> print(f"Status: {response.message}")
+        """
+        self._check_device_id(device_id)
+        url = self.base_url + self._NEXT_PATH.format(device_id)
+        if not parse_response:
+            request = self._client.build_request("POST", url)
+            await self._send(lambda: self._send_discarding_body(request))
+            self._invalidate_status(device_id)
+            return None
+
+        response = await self._request("POST", url)
+        self._invalidate_status(device_id)
+        return self._parse_api_response(response)
+
+    async def list_tasks(self, device_id: str, task_type: str = "loop") -> List[Task]:
+        """List all tasks for a specific device.
+
+        Args:
+            device_id: Device serial number
+            task_type: Task type (currently only "loop" is supported)
+
+        Returns:
+            List of Task objects for the device
+
+        Raises:
+            NotFoundError: If device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+            ValidationError: If task_type is invalid
+
+        Example:
+            >>> tasks = await client.list_tasks("abc123", task_type="loop")
+        """
+        self._check_device_id(device_id)
+        self._check_task_type(task_type)
+
+        response = await self._request(
+            "GET", self.base_url + self._TASKS_PATH.format(device_id, task_type)
+        )
+        return self._parse_tasks_reusing((device_id, task_type), response)
+
+    async def send_text(
+        self, device_id: str, content: TextContentRequest
+    ) -> APIResponse:
+        """Send text content to the device.
+
+        Args:
+            device_id: Device serial number
+            content: TextContentRequest object containing the text to display
+
+        Returns:
+            APIResponse object with the response data
+
+        Raises:
+            NotFoundError: If device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+            ValidationError: If content validation fails
+
+        Example:
+            >>> text_req = TextContentRequest(title="Hello", message="World!")
+            >>> response = await client.send_text("abc123", text_req)
+        """
+        self._check_device_id(device_id)
+        response = await self._request(
+            "POST",
+            self.base_url + self._TEXT_PATH.format(device_id),
+            content=content.model_dump_json(exclude_none=True).encode(),
+        )
+        self._invalidate_status(device_id)
+        return self._parse_api_response(response)
+
+    async def send_text_many(
+        self, payloads: Dict[str, TextContentRequest]
+    ) -> Dict[str, APIResponse]:
+        """Send text content to several devices concurrently.
+
+        At most ``MAX_CONCURRENCY`` requests are in flight at a time.
+
+        Args:
+            payloads: Mapping of device serial number to the text to display
+
+        Returns:
+            Mapping of device serial number to its APIResponse
+
+        Raises:
+            NotFoundError: If any device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+            ValidationError: If any device_id is malformed
+
+        Example:
+            >>> responses = await client.send_text_many({
+            ...     "abc123": TextContentRequest(title="Hi", message="Kitchen"),
+            ...     "def456": TextContentRequest(title="Hi", message="Office"),
+            ... })
+        """
+        for device_id in payloads:
+            self._check_device_id(device_id)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        async def send(device_id: str, content: TextContentRequest) -> APIResponse:
+            async with semaphore:
+                return await self.send_text(device_id, content)
+
+        results = await asyncio.gather(*(send(d, c) for d, c in payloads.items()))
+        return dict(zip(payloads.keys(), results))
+
+    async def send_image(
+        self, device_id: str, content: ImageContentRequest
+    ) -> APIResponse:
+        """Send image content to the device.
+
+        Args:
+            device_id: Device serial number
+            content: ImageContentRequest object containing the image to display
+
+        Returns:
+            APIResponse object with the response data
+
+        Raises:
+            NotFoundError: If device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+            ValidationError: If content validation fails
+
+        Example:
+            >>> image_req = ImageContentRequest(image="base64_encoded_image_data")
+            >>> response = await client.send_image("abc123", image_req)
+        """
+        self._check_device_id(device_id)
+        response = await self._request(
+            "POST",
+            self.base_url + self._IMAGE_PATH.format(device_id),
+            content=content.model_dump_json(exclude_none=True).encode(),
+        )
+        self._invalidate_status(device_id)
+        return self._parse_api_response(response)
+
+    async def send_image_from_path(
+        self, device_id: str, path: Union[str, os.PathLike], **options: Any
+    ) -> APIResponse:
+        """Read an image file, Base64-encode it and send it to the device.
+
+        The file is read in a worker thread so the event loop is not blocked.
+
+        Args:
+            device_id: Device serial number
+            path: Path to a PNG image (296px×152px)
+            **options: Other ImageContentRequest fields (border, ditherType, ...)
+
+        Returns:
+            APIResponse object with the response data
+
+        Example:
+            >>> response = await client.send_image_from_path("abc123", "image.png")
+        """
+        self._check_device_id(device_id)
+        image = await asyncio.to_thread(self._read_image, path)
+        return await self.send_image(
+            device_id, ImageContentRequest.from_png_bytes(image, **options)
+        )
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Make HTTP request to the API endpoint.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Full request URL (base URL joined with the endpoint path)
+            **kwargs: Additional arguments for httpx.AsyncClient.request
+
+        Returns:
+            httpx.Response object
+
+        Raises:
+            AuthenticationError: On 401 Unauthorized
+            PermissionError: On 403 Forbidden
+            NotFoundError: On 404 Not Found
+            ValidationError: On 400 Bad Request
+            RateLimitError: On rate limit exceeded (429) after all retries
+            Quote0Error: On other server errors (500)
+        """
+        # Authorization and Content-Type are set once on the client
+        return await self._send(lambda: self._client.request(method, url, **kwargs))
+
+    async def _send_discarding_body(self, request: httpx.Request) -> httpx.Response:
+        """Send a request and drain its body without decoding it.
+
+        The raw bytes are read so the connection can go back to the pool,
+        but they are never decompressed or stored on the response.
+
+        Args:
+            request: Pre-built request
+
+        Returns:
+            Closed httpx.Response with status and headers only
+        """
+        response = await self._client.send(request, stream=True)
+        try:
+            # Mock transports hand back responses that were already read
+            if not response.is_stream_consumed:
+                async for _ in response.aiter_raw():
+                    pass
+        finally:
+            await response.aclose()
+        return response
+
+    async def _send(
+        self, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Issue a request, retrying it while the API answers 429.
+
+        Args:
+            send: Zero-argument callable performing the HTTP call
+
+        Returns:
+            httpx.Response object with a successful status
+
+        Raises:
+            RateLimitError: If the request is still rate-limited after
+                max_retries retries, or Retry-After exceeds MAX_RETRY_DELAY
+            Quote0Error: On any other error status (see _handle_response)
+        """
+        for attempt in range(self.max_retries + 1):
+            response = await send()
+            if response.status_code != 429 or attempt == self.max_retries:
+                break
+            delay = self._retry_delay(attempt, response)
+            if delay is None:
+                # Server wants a longer pause than we block for; give up now
+                break
+            await asyncio.sleep(delay)
+
+        self._handle_response(response)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the internal HTTP client.
+
+        Example:
+            >>> client = AsyncQuote0Client(api_key="test-key")
+            >>> try:
+            ...     # Use client...
+            ...     pass
+            ... finally:
+            ...     await client.aclose()
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
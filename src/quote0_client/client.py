@@ -6,9 +6,23 @@ via API key.
 """
 
 import httpx
-from typing import List, Any, Optional
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Any,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
 
 from .models import (
+    BatterySnapshot,
     Device,
     DeviceStatus,
     Task,
@@ -16,17 +30,27 @@ from .models import (
     ImageContentRequest,
     APIResponse,
 )
-from .exceptions import (
-    Quote0Error,
-    AuthenticationError,
-    NotFoundError,
-    PermissionError,
-    ValidationError,
-    RateLimitError,
-)
+from ._base import BaseClient
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Transport wrapper that leaves the shared connection pool open on close.
 
+    Closing a Quote0Client must not tear down connections still used by
+    other client instances talking to the same base URL.
+    """
+
+    def __init__(self, transport: httpx.HTTPTransport):
+        self._transport = transport
 
-class Quote0Client:
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class Quote0Client(BaseClient):
     """Client for interacting with Quote0 e-ink device API.
 
     This class provides a high-level interface for managing Quote0 devices,
@@ -38,34 +62,81 @@ class Quote0Client:
         base_url: Base URL of the API endpoint
         _client: Internal HTTP client instance
 
+    Clients with the same base URL share one connection pool, so creating a
+    short-lived client per script or request reuses warm TCP/TLS connections.
+    Pools are per process, so a forked child never reuses the parent's
+    sockets; close_shared_transports() releases them.
+
     Example:
         >>> client = Quote0Client(api_key="your-api-key")
         >>> devices = client.get_devices()
         >>> status = client.get_device_status("device-serial-number")
     """
 
-    BASE_URL = "https://dot.mindreset.tech"
-
-    def __init__(self, api_key: str, base_url: Optional[str] = None):
+    # Connection pools shared by all instances, keyed by (process id, base URL)
+    _SHARED_TRANSPORTS: Dict[Tuple[int, str], httpx.HTTPTransport] = {}
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.1,
+        validate_responses: bool = True,
+        transport: Optional[httpx.BaseTransport] = None,
+        reuse_tasks: bool = False,
+    ):
         """Initialize client with API key.
 
         Args:
             api_key: API key from Dot. App
             base_url: Optional base URL (default: https://dot.mindreset.tech)
+            max_retries: How often a rate-limited (429) request is retried
+                (default: 3, 0 disables retries)
+            backoff_base: Initial retry delay in seconds (default: 0.1)
+            validate_responses: Validate API responses with pydantic (default:
+                True); False builds models without validation, which is
+                faster but trusts the server to send well-formed data
+            transport: Optional httpx transport to use instead of the shared
+                connection pool (e.g. httpx.MockTransport in tests)
+            reuse_tasks: Skip re-parsing a device's task list while it is
+                unchanged, returning copies of the cached tasks (default: False)
 
         Raises:
-            ValueError: If api_key is empty
+            ValueError: If api_key is empty or max_retries is negative
         """
-        if not api_key or not api_key.strip():
-            raise ValueError("api_key cannot be empty")
-
-        self.api_key = api_key
-        self.base_url: str = base_url or self.BASE_URL
-        self._client = httpx.Client(trust_env=False, timeout=30.0)
-
-    def get_devices(self) -> List[Device]:
+        super().__init__(
+            api_key,
+            base_url,
+            max_retries,
+            backoff_base,
+            validate_responses,
+            reuse_tasks,
+        )
+        options = self._client_options()
+        # http2 and limits configure the pool, which lives on the transport
+        http2 = options.pop("http2")
+        limits = options.pop("limits")
+        if transport is None:
+            key = (os.getpid(), self.base_url)
+            shared = self._SHARED_TRANSPORTS.get(key)
+            if shared is None:
+                shared = self._SHARED_TRANSPORTS.setdefault(
+                    key,
+                    httpx.HTTPTransport(
+                        http2=http2, limits=limits, trust_env=options["trust_env"]
+                    ),
+                )
+            transport = _SharedTransport(shared)
+        self._client = httpx.Client(transport=transport, **options)
+
+    def get_devices(self, ttl_ms: int = 0) -> List[Device]:
         """Get list of all registered devices.
 
+        Args:
+            ttl_ms: Return the previously fetched list if it is younger than
+                this many milliseconds (default: 0, always fetch)
+
         Returns:
             List of Device objects representing all registered devices
 
@@ -74,15 +145,22 @@ class Quote0Client:
             >>> devices = client.get_devices()
             >>> print(f"Found {len(devices)} devices")
         """
-        response = self._request("GET", "/api/authV2/open/devices")
-        devices_data = response.json()
-        return [Device(**device) for device in devices_data]
+        cached = self._cached_devices(ttl_ms)
+        if cached is not None:
+            return cached
 
-    def get_device_status(self, device_id: str) -> DeviceStatus:
+        response = self._request("GET", self.base_url + self._DEVICES_PATH)
+        devices = self._parse_devices(response)
+        self._store_devices(devices)
+        return devices
+
+    def get_device_status(self, device_id: str, ttl_ms: int = 0) -> DeviceStatus:
         """Get the current status of a specific device.
 
         Args:
             device_id: Device serial number
+            ttl_ms: Return the previously fetched status if it is younger than
+                this many milliseconds (default: 0, always fetch)
 
         Returns:
             DeviceStatus object containing device information, battery status,
@@ -92,37 +170,173 @@ class Quote0Client:
             NotFoundError: If device_id does not exist
             AuthenticationError: If authentication fails
             PermissionError: If insufficient permissions
+            ValidationError: If device_id is malformed
 
         Example:
             >>> status = client.get_device_status("abc123")
             >>> print(f"Battery: {status.status.battery}")
             >>> print(f"Location: {status.location}")
         """
-        response = self._request("GET", f"/api/authV2/open/device/{device_id}/status")
-        return DeviceStatus(**response.json())
+        self._check_device_id(device_id)
+        cached = self._cached_status(device_id, ttl_ms)
+        if cached is not None:
+            return cached
+
+        response = self._request(
+            "GET", self.base_url + self._STATUS_PATH.format(device_id)
+        )
+        status = self._parse_status(response)
+        self._store_status(device_id, status)
+        return status
+
+    def get_device_status_minimal(self, device_id: str) -> BatterySnapshot:
+        """Get only the battery and WiFi status of a device.
+
+        Reads the two fields straight from the decoded JSON without building
+        the full DeviceStatus model, which makes it cheap for monitoring loops.
+
+        Args:
+            device_id: Device serial number
+
+        Returns:
+            BatterySnapshot with device_id, battery and wifi
+
+        Raises:
+            NotFoundError: If device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+            ValidationError: If device_id is malformed
+
+        Example:
+            >>> snapshot = client.get_device_status_minimal("abc123")
+            >>> print(f"{snapshot.battery} / {snapshot.wifi}")
+        """
+        self._check_device_id(device_id)
+        response = self._request(
+            "GET", self.base_url + self._STATUS_PATH.format(device_id)
+        )
+        return self._parse_battery_snapshot(response)
+
+    def prepare_status_poller(self, device_id: str) -> Callable[[], DeviceStatus]:
+        """Build a callable that fetches the status of one device repeatedly.
+
+        The HTTP request (URL, headers) is built once up front and re-sent on
+        every call, so tight polling loops skip URL parsing and header merging.
+        Each poll refreshes the ttl_ms cache used by get_device_status.
+
+        Args:
+            device_id: Device serial number
+
+        Returns:
+            Zero-argument callable returning a fresh DeviceStatus
+
+        Raises:
+            NotFoundError: If device_id does not exist (raised by the callable)
+            AuthenticationError: If authentication fails (raised by the callable)
+
+        Example:
+            >>> poll = client.prepare_status_poller("abc123")
+            >>> while True:
+            ...     print(poll().status.battery)
+            ...     time.sleep(60)
+        """
+        self._check_device_id(device_id)
+        request = self._client.build_request(
+            "GET", self.base_url + self._STATUS_PATH.format(device_id)
+        )
+
+        def poll() -> DeviceStatus:
+            response = self._send(lambda: self._client.send(request))
+            status = self._parse_status(response)
+            self._store_status(device_id, status)
+            return status
+
+        return poll
+
+    def get_device_statuses(self, device_ids: List[str]) -> List[DeviceStatus]:
+        """Get the current status of several devices concurrently.
+
+        Requests are issued from a small thread pool (at most
+        ``MAX_CONCURRENCY`` at a time) sharing this client's connection pool,
+        so N devices take roughly one round trip instead of N.
+
+        Args:
+            device_ids: Device serial numbers
+
+        Returns:
+            List of DeviceStatus objects in the same order as device_ids
+
+        Raises:
+            NotFoundError: If any device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
 
-    def switch_to_next(self, device_id: str) -> APIResponse:
+        Example:
+            >>> statuses = client.get_device_statuses(["abc123", "def456"])
+            >>> for status in statuses:
+            ...     print(f"{status.deviceId}: {status.status.battery}")
+        """
+        for device_id in device_ids:
+            self._check_device_id(device_id)
+        if not device_ids:
+            return []
+
+        max_workers = min(len(device_ids), self.MAX_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_device_status, device_ids))
+
+    @overload
+    def switch_to_next(
+        self, device_id: str, parse_response: Literal[True] = ...
+    ) -> APIResponse: ...
+
+    @overload
+    def switch_to_next(
+        self, device_id: str, parse_response: Literal[False]
+    ) -> None: ...
+
+    @overload
+    def switch_to_next(
+        self, device_id: str, parse_response: bool = ...
+    ) -> Optional[APIResponse]: ...
+
+    def switch_to_next(
+        self, device_id: str, parse_response: bool = True
+    ) -> Optional[APIResponse]:
         """Switch device to the next content.
 
         This method advances the device to the next content in the content queue.
 
         Args:
             device_id: Device serial number
+            parse_response: Set to False for fire-and-forget calls; the body
+                is then discarded undecoded and None is returned
 
         Returns:
-            APIResponse object with the response data
+            APIResponse object with the response data, or None if
+            parse_response is False
 
         Raises:
             NotFoundError: If device_id does not exist
             AuthenticationError: If authentication fails
             PermissionError: If insufficient permissions
+            ValidationError: If device_id is malformed
 
         Example:
             >>> response = client.switch_to_next("abc123")
             >>> print(f"Status: {response.message}")
         """
-        response = self._request("POST", f"/api/authV2/open/device/{device_id}/next")
-        return APIResponse(**response.json())
+        self._check_device_id(device_id)
+        url = self.base_url + self._NEXT_PATH.format(device_id)
+        if not parse_response:
+            request = self._client.build_request("POST", url)
+            self._send(lambda: self._send_discarding_body(request))
+            self._invalidate_status(device_id)
+            return None
+
+        response = self._request("POST", url)
+        self._invalidate_status(device_id)
+        return self._parse_api_response(response)
 
     def list_tasks(self, device_id: str, task_type: str = "loop") -> List[Task]:
         """List all tasks for a specific device.
@@ -145,16 +359,13 @@ class Quote0Client:
             >>> for task in tasks:
             ...     print(f"Task: {task.key}, Type: {task.type}")
         """
-        if task_type != "loop":
-            raise ValidationError(
-                f"Invalid task_type: {task_type}. Only 'loop' is currently supported."
-            )
+        self._check_device_id(device_id)
+        self._check_task_type(task_type)
 
         response = self._request(
-            "GET", f"/api/authV2/open/device/{device_id}/{task_type}/list"
+            "GET", self.base_url + self._TASKS_PATH.format(device_id, task_type)
         )
-        tasks_data = response.json()
-        return [Task(**task) for task in tasks_data]
+        return self._parse_tasks_reusing((device_id, task_type), response)
 
     def send_text(self, device_id: str, content: TextContentRequest) -> APIResponse:
         """Send text content to the device.
@@ -183,12 +394,51 @@ class Quote0Client:
             >>> response = client.send_text("abc123", text_req)
             >>> print(f"Sent: {response.message}")
         """
+        self._check_device_id(device_id)
         response = self._request(
             "POST",
-            f"/api/authV2/open/device/{device_id}/text",
-            json=content.model_dump(exclude_none=True),
+            self.base_url + self._TEXT_PATH.format(device_id),
+            content=content.model_dump_json(exclude_none=True).encode(),
         )
-        return APIResponse(**response.json())
+        self._invalidate_status(device_id)
+        return self._parse_api_response(response)
+
+    def send_text_many(
+        self, payloads: Dict[str, TextContentRequest]
+    ) -> Dict[str, APIResponse]:
+        """Send text content to several devices concurrently.
+
+        Requests are issued from a small thread pool (at most
+        ``MAX_CONCURRENCY`` at a time), so pushing to N devices takes roughly
+        one round trip instead of N.
+
+        Args:
+            payloads: Mapping of device serial number to the text to display
+
+        Returns:
+            Mapping of device serial number to its APIResponse
+
+        Raises:
+            NotFoundError: If any device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+            ValidationError: If any device_id is malformed
+
+        Example:
+            >>> responses = client.send_text_many({
+            ...     "abc123": TextContentRequest(title="Hi", message="Kitchen"),
+            ...     "def456": TextContentRequest(title="Hi", message="Office"),
+            ... })
+        """
+        for device_id in payloads:
+            self._check_device_id(device_id)
+        if not payloads:
+            return {}
+
+        max_workers = min(len(payloads), self.MAX_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.send_text, payloads.keys(), payloads.values())
+            return dict(zip(payloads.keys(), results))
 
     def send_image(self, device_id: str, content: ImageContentRequest) -> APIResponse:
         """Send image content to the device.
@@ -217,21 +467,49 @@ class Quote0Client:
             >>> response = client.send_image("abc123", image_req)
             >>> print(f"Sent: {response.message}")
         """
+        self._check_device_id(device_id)
         response = self._request(
             "POST",
-            f"/api/authV2/open/device/{device_id}/image",
-            json=content.model_dump(exclude_none=True),
+            self.base_url + self._IMAGE_PATH.format(device_id),
+            content=content.model_dump_json(exclude_none=True).encode(),
         )
-        return APIResponse(**response.json())
+        self._invalidate_status(device_id)
+        return self._parse_api_response(response)
+
+    def send_image_from_path(
+        self, device_id: str, path: Union[str, os.PathLike], **options: Any
+    ) -> APIResponse:
+        """Read an image file, Base64-encode it and send it to the device.
+
+        Args:
+            device_id: Device serial number
+            path: Path to a PNG image (296px×152px)
+            **options: Other ImageContentRequest fields (border, ditherType, ...)
+
+        Returns:
+            APIResponse object with the response data
 
-    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        Raises:
+            NotFoundError: If device_id does not exist
+            AuthenticationError: If authentication fails
+            PermissionError: If insufficient permissions
+            ValidationError: If content validation fails
+
+        Example:
+            >>> response = client.send_image_from_path("abc123", "image.png", border=1)
+        """
+        self._check_device_id(device_id)
+        content = ImageContentRequest.from_png_bytes(self._read_image(path), **options)
+        return self.send_image(device_id, content)
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
         """Make HTTP request to the API endpoint.
 
         This is a private method that handles the actual HTTP communication.
 
         Args:
             method: HTTP method (GET, POST, etc.)
-            path: API endpoint path (without base URL)
+            url: Full request URL (base URL joined with the endpoint path)
             **kwargs: Additional arguments for httpx.request
 
         Returns:
@@ -242,82 +520,67 @@ class Quote0Client:
             PermissionError: On 403 Forbidden
             NotFoundError: On 404 Not Found
             ValidationError: On 400 Bad Request
-            RateLimitError: On rate limit exceeded (400)
+            RateLimitError: On rate limit exceeded (429) after all retries
             Quote0Error: On other server errors (500)
         """
-        url = f"{self.base_url}{path}"
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        # Authorization and Content-Type are set once on the client
+        return self._send(lambda: self._client.request(method, url, **kwargs))
 
-        # Add headers to kwargs if not already present
-        request_kwargs = kwargs.copy()
-        if "headers" not in request_kwargs:
-            request_kwargs["headers"] = headers
-        else:
-            # Merge headers, giving precedence to passed headers
-            for key, value in headers.items():
-                if key not in request_kwargs["headers"]:
-                    request_kwargs["headers"][key] = value
+    def _send_discarding_body(self, request: httpx.Request) -> httpx.Response:
+        """Send a request and drain its body without decoding it.
 
-        response = self._client.request(method, url, **request_kwargs)
+        The raw bytes are read so the connection can go back to the pool,
+        but they are never decompressed or stored on the response.
 
-        self._handle_response(response)
+        Args:
+            request: Pre-built request
 
+        Returns:
+            Closed httpx.Response with status and headers only
+        """
+        response = self._client.send(request, stream=True)
+        try:
+            # Mock transports hand back responses that were already read
+            if not response.is_stream_consumed:
+                for _ in response.iter_raw():
+                    pass
+        finally:
+            response.close()
         return response
 
-    def _handle_response(self, response: httpx.Response) -> None:
-        """Handle API response and raise appropriate exceptions.
-
-        This method maps HTTP status codes to appropriate exception types.
+    def _send(self, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """Issue a request, retrying it while the API answers 429.
 
         Args:
-            response: httpx.Response object to process
+            send: Zero-argument callable performing the HTTP call
+
+        Returns:
+            httpx.Response object with a successful status
 
         Raises:
-            AuthenticationError: On 401 Unauthorized
-            PermissionError: On 403 Forbidden
-            NotFoundError: On 404 Not Found
-            ValidationError: On 400 Bad Request
-            RateLimitError: On rate limit exceeded
-            Quote0Error: On 500 Server Error
+            RateLimitError: If the request is still rate-limited after
+                max_retries retries, or Retry-After exceeds MAX_RETRY_DELAY
+            Quote0Error: On any other error status (see _handle_response)
         """
-        status_code = response.status_code
-
-        if status_code == 200:
-            # Success
-            return
-        elif status_code == 400:
-            # Bad Request - validation error
-            raise ValidationError("Request validation failed")
-        elif status_code == 401:
-            # Unauthorized - invalid credentials
-            raise AuthenticationError("Invalid API key or authentication failed")
-        elif status_code == 403:
-            # Forbidden - insufficient permissions
-            raise PermissionError("Insufficient permissions to access this resource")
-        elif status_code == 404:
-            # Not Found - resource doesn't exist
-            raise NotFoundError("Device or resource not found")
-        elif status_code == 429:
-            # Rate Limit - too many requests
-            raise RateLimitError(
-                "Rate limit exceeded. Please reduce request frequency."
-            )
-        elif 500 <= status_code < 600:
-            # Server Error
-            raise Quote0Error(f"Server error: {status_code}")
-        else:
-            # Unknown status code
-            raise Quote0Error(f"Unexpected status code: {status_code}")
+        for attempt in range(self.max_retries + 1):
+            response = send()
+            if response.status_code != 429 or attempt == self.max_retries:
+                break
+            delay = self._retry_delay(attempt, response)
+            if delay is None:
+                # Server wants a longer pause than we block for; give up now
+                break
+            time.sleep(delay)
+
+        self._handle_response(response)
+        return response
 
     def close(self) -> None:
         """Close the internal HTTP client.
 
         This method should be called when the client is no longer needed
-        to properly clean up resources.
+        to properly clean up resources. The shared connection pool stays
+        open for other clients with the same base URL.
 
         Example:
             >>> client = Quote0Client(api_key="test-key")
@@ -329,6 +592,24 @@ class Quote0Client:
         """
         self._client.close()
 
+    @classmethod
+    def close_shared_transports(cls) -> None:
+        """Close the connection pools shared between clients.
+
+        Call this at shutdown once every client is closed. Pools inherited
+        from a parent process are dropped without closing them, as their
+        sockets still belong to the parent.
+
+        Example:
+            >>> client.close()
+            >>> Quote0Client.close_shared_transports()
+        """
+        pid = os.getpid()
+        for key in list(cls._SHARED_TRANSPORTS):
+            transport = cls._SHARED_TRANSPORTS.pop(key)
+            if key[0] == pid:
+                transport.close()
+
     def __enter__(self):
         """Context manager entry."""
         return self
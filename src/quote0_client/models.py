@@ -4,8 +4,21 @@ This module defines all data models for the Quote0 SDK, including device informa
 status, rendering info, tasks, and API requests/responses.
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+import base64
+from typing import Optional, List, Dict, Any, NamedTuple
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared by every model: build validators on first use and drop unknown
+# response keys. The remaining flags are spelled out at pydantic's defaults
+# so the models stay on pydantic-core's plain, unconstrained fast paths.
+_MODEL_CONFIG = ConfigDict(
+    defer_build=True,
+    extra="ignore",
+    validate_assignment=False,
+    str_strip_whitespace=False,
+    arbitrary_types_allowed=False,
+    frozen=False,
+)
 
 
 class Device(BaseModel):
@@ -18,6 +31,8 @@ class Device(BaseModel):
         id: Device serial number
     """
 
+    model_config = _MODEL_CONFIG
+
     series: str = Field(description="Device series (e.g., 'quote')")
     model: str = Field(description="Device model (e.g., 'quote_0')")
     edition: int = Field(description="Device edition (1 or 2)")
@@ -35,6 +50,8 @@ class BatteryStatus(BaseModel):
         wifi: WiFi signal strength
     """
 
+    model_config = _MODEL_CONFIG
+
     version: str = Field(description="Battery firmware version")
     current: str = Field(description="Current battery status")
     description: str = Field(description="Description of current status")
@@ -42,20 +59,6 @@ class BatteryStatus(BaseModel):
     wifi: str = Field(description="WiFi signal strength")
 
 
-class RenderInfo(BaseModel):
-    """Rendering information for a device.
-
-    Attributes:
-        last: Last render timestamp
-        current: Current render information
-        next: Next render time information
-    """
-
-    last: str = Field(description="Last render timestamp")
-    current: "CurrentRenderInfo" = Field(description="Current render information")
-    next: "NextRenderTime" = Field(description="Next render time information")
-
-
 class CurrentRenderInfo(BaseModel):
     """Current render information.
 
@@ -65,6 +68,8 @@ class CurrentRenderInfo(BaseModel):
         image: List of render image URLs
     """
 
+    model_config = _MODEL_CONFIG
+
     rotated: bool = Field(description="Whether the display is rotated")
     border: int = Field(description="Border style (0=white, 1=black)")
     image: List[str] = Field(description="List of render image URLs")
@@ -78,10 +83,28 @@ class NextRenderTime(BaseModel):
         power: Next power update timestamp
     """
 
+    model_config = _MODEL_CONFIG
+
     battery: str = Field(description="Next battery update timestamp")
     power: str = Field(description="Next power update timestamp")
 
 
+class RenderInfo(BaseModel):
+    """Rendering information for a device.
+
+    Attributes:
+        last: Last render timestamp
+        current: Current render information
+        next: Next render time information
+    """
+
+    model_config = _MODEL_CONFIG
+
+    last: str = Field(description="Last render timestamp")
+    current: CurrentRenderInfo = Field(description="Current render information")
+    next: NextRenderTime = Field(description="Next render time information")
+
+
 class DeviceStatus(BaseModel):
     """Complete device status information.
 
@@ -93,6 +116,8 @@ class DeviceStatus(BaseModel):
         renderInfo: Rendering information
     """
 
+    model_config = _MODEL_CONFIG
+
     deviceId: str = Field(description="Device serial number")
     alias: Optional[str] = Field(default=None, description="Optional device alias")
     location: Optional[str] = Field(
@@ -102,6 +127,23 @@ class DeviceStatus(BaseModel):
     renderInfo: RenderInfo = Field(description="Rendering information")
 
 
+class BatterySnapshot(NamedTuple):
+    """Lightweight battery/WiFi reading of a device.
+
+    Returned by ``get_device_status_minimal`` for monitoring loops that only
+    need these fields and want to skip building the full DeviceStatus tree.
+
+    Attributes:
+        device_id: Device serial number
+        battery: Battery level status
+        wifi: WiFi signal strength
+    """
+
+    device_id: str
+    battery: str
+    wifi: str
+
+
 class Task(BaseModel):
     """Task information for the device.
 
@@ -116,6 +158,8 @@ class Task(BaseModel):
         ditherKernel: Dither kernel (for IMAGE_API tasks)
     """
 
+    model_config = _MODEL_CONFIG
+
     type: str = Field(description="Task type (TEXT_API or IMAGE_API)")
     key: str = Field(description="Unique task key")
     refreshNow: bool = Field(default=True, description="Whether to refresh immediately")
@@ -128,11 +172,11 @@ class Task(BaseModel):
     border: Optional[int] = Field(
         default=None, description="Border style (0 or 1, for IMAGE_API tasks)"
     )
-    ditherType: Optional[str] = Field(
+    ditherType: str = Field(
         default="DIFFUSION",
         description="Dither type (DIFFUSION, ORDERED, or NONE, for IMAGE_API tasks)",
     )
-    ditherKernel: Optional[str] = Field(
+    ditherKernel: str = Field(
         default="FLOYD_STEINBERG", description="Dither kernel (for IMAGE_API tasks)"
     )
 
@@ -150,6 +194,8 @@ class TextContentRequest(BaseModel):
         taskKey: Optional task key
     """
 
+    model_config = _MODEL_CONFIG
+
     refreshNow: Optional[bool] = Field(
         default=True, description="Whether to refresh immediately"
     )
@@ -170,7 +216,8 @@ class ImageContentRequest(BaseModel):
 
     Attributes:
         refreshNow: Whether to refresh immediately (default: True)
-        image: Base64 PNG image (296px×152px, required)
+        image: Base64 PNG image (296px×152px, required); use from_png_bytes
+            to build a request from raw PNG bytes
         link: Optional URL link
         border: Border style (default: 0, 0=white, 1=black)
         ditherType: Dither type (default: DIFFUSION, options: DIFFUSION, ORDERED, NONE)
@@ -178,6 +225,8 @@ class ImageContentRequest(BaseModel):
         taskKey: Optional task key
     """
 
+    model_config = _MODEL_CONFIG
+
     refreshNow: Optional[bool] = Field(
         default=True, description="Whether to refresh immediately"
     )
@@ -194,12 +243,26 @@ class ImageContentRequest(BaseModel):
     )
     taskKey: Optional[str] = Field(default=None, description="Optional task key")
 
+    @classmethod
+    def from_png_bytes(cls, data: bytes, **options: Any) -> "ImageContentRequest":
+        """Build a request from raw PNG bytes.
+
+        Args:
+            data: Raw PNG file contents (296px×152px)
+            **options: Other ImageContentRequest fields (border, ditherType, ...)
+
+        Returns:
+            ImageContentRequest with the image Base64-encoded
+        """
+        return cls(image=base64.b64encode(data).decode("ascii"), **options)
+
 
 class APIResponse(BaseModel):
     """Generic API response wrapper.
 
     Attributes:
-        code: Response code (0 for success, non-zero for errors) - can be string or int
+        code: Response code (0 for success, non-zero for errors); numeric
+            strings sent by the server are coerced to int
         message: Response message
         result: Response result data (optional)
 
@@ -207,9 +270,9 @@ class APIResponse(BaseModel):
         >>> APIResponse(code=0, message="Success", result={"message": "Done"})
     """
 
-    code: str | int = Field(
-        description="Response code (0 for success, non-zero for errors)"
-    )
+    model_config = _MODEL_CONFIG
+
+    code: int = Field(description="Response code (0 for success, non-zero for errors)")
     message: str = Field(description="Response message")
     result: Optional[Dict[str, Any]] = Field(
         default=None, description="Response result data"
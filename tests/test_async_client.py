@@ -0,0 +1,402 @@
+"""Unit tests for AsyncQuote0Client.
+
+This module mirrors the Quote0Client tests for the asynchronous client,
+covering success scenarios, error mapping and concurrent usage.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from quote0_client.async_client import AsyncQuote0Client
+from quote0_client.models import (
+    Device,
+    DeviceStatus,
+    Task,
+    TextContentRequest,
+    ImageContentRequest,
+    APIResponse,
+)
+from quote0_client.exceptions import (
+    Quote0Error,
+    AuthenticationError,
+    NotFoundError,
+    ValidationError,
+    RateLimitError,
+)
+
+
+STATUS_DATA = {
+    "deviceId": "ABC123",
+    "alias": "Living Room Quote",
+    "location": "Home",
+    "status": {
+        "version": "1.0.0",
+        "current": "100%",
+        "description": "Fully charged",
+        "battery": "100%",
+        "wifi": "Excellent",
+    },
+    "renderInfo": {
+        "last": "2025-02-02 12:00:00",
+        "current": {
+            "rotated": False,
+            "border": 0,
+            "image": ["https://example.com/image1.png"],
+        },
+        "next": {
+            "battery": "2025-02-02 13:00:00",
+            "power": "2025-02-02 13:00:00",
+        },
+    },
+}
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def mock_response() -> Mock:
+    """Create a mock HTTP response with status 200 and an empty JSON body."""
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps({}).encode()
+    return response
+
+
+@pytest.fixture
+def async_client():
+    """Create a test AsyncQuote0Client instance."""
+    return AsyncQuote0Client(api_key="test-api-key-12345")
+
+
+def patch_request(client: AsyncQuote0Client, response: Mock):
+    """Patch the internal AsyncClient.request to return the given response."""
+    return patch.object(client._client, "request", new=AsyncMock(return_value=response))
+
+
+# ============================================================================
+# Test: API methods
+# ============================================================================
+
+
+class TestAsyncMethods:
+    """Test cases for AsyncQuote0Client API methods."""
+
+    @pytest.mark.asyncio
+    async def test_get_devices_success(self, async_client, mock_response):
+        """Test successfully retrieving device list."""
+        mock_response.content = json.dumps(
+            [
+                {"series": "quote", "model": "quote_0", "edition": 1, "id": "ABC123"},
+            ]
+        ).encode()
+
+        with patch_request(async_client, mock_response):
+            devices = await async_client.get_devices()
+
+        assert len(devices) == 1
+        assert isinstance(devices[0], Device)
+        assert devices[0].id == "ABC123"
+
+    @pytest.mark.asyncio
+    async def test_get_device_status_success(self, async_client, mock_response):
+        """Test successfully retrieving device status."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+
+        with patch_request(async_client, mock_response):
+            status = await async_client.get_device_status("ABC123")
+
+        assert isinstance(status, DeviceStatus)
+        assert status.deviceId == "ABC123"
+        assert status.status.wifi == "Excellent"
+
+    @pytest.mark.asyncio
+    async def test_get_device_status_minimal(self, async_client, mock_response):
+        """Test battery and WiFi are extracted without the full model."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+
+        with patch_request(async_client, mock_response):
+            snapshot = await async_client.get_device_status_minimal("ABC123")
+
+        assert snapshot == ("ABC123", "100%", "Excellent")
+
+    @pytest.mark.asyncio
+    async def test_switch_to_next_success(self, async_client, mock_response):
+        """Test successfully switching to next content."""
+        mock_response.content = json.dumps({"code": 0, "message": "Switched"}).encode()
+
+        with patch_request(async_client, mock_response):
+            response = await async_client.switch_to_next("ABC123")
+
+        assert isinstance(response, APIResponse)
+        assert response.success is True
+
+    @pytest.mark.asyncio
+    async def test_switch_to_next_without_parsing(self, async_client, mock_response):
+        """Test parse_response=False drains the raw body and returns None."""
+
+        async def raw_chunks():
+            yield b'{"code": 0}'
+
+        mock_response.is_stream_consumed = False
+        mock_response.aiter_raw = raw_chunks
+        mock_response.aclose = AsyncMock()
+
+        with patch.object(
+            async_client._client, "send", new=AsyncMock(return_value=mock_response)
+        ) as mock_send:
+            result = await async_client.switch_to_next("ABC123", parse_response=False)
+
+        assert result is None
+        assert mock_send.await_args.kwargs == {"stream": True}
+        mock_response.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_switch_to_next_without_parsing_mock_transport(self):
+        """Test parse_response=False works when the body was already read."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"code": 0})
+        )
+        client = AsyncQuote0Client(api_key="test-key", transport=transport)
+
+        assert await client.switch_to_next("ABC123", parse_response=False) is None
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_success(self, async_client, mock_response):
+        """Test successfully listing tasks."""
+        mock_response.content = json.dumps(
+            [{"type": "TEXT_API", "key": "task-001"}]
+        ).encode()
+
+        with patch_request(async_client, mock_response):
+            tasks = await async_client.list_tasks("ABC123")
+
+        assert len(tasks) == 1
+        assert isinstance(tasks[0], Task)
+        assert tasks[0].key == "task-001"
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_invalid_task_type(self, async_client):
+        """Test ValidationError for invalid task_type."""
+        with pytest.raises(ValidationError) as exc_info:
+            await async_client.list_tasks("ABC123", task_type="invalid")
+
+        assert "Invalid task_type: invalid" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_send_text_success(self, async_client, mock_response):
+        """Test successfully sending text content."""
+        mock_response.content = json.dumps({"code": 0, "message": "Text sent"}).encode()
+
+        with patch_request(async_client, mock_response):
+            response = await async_client.send_text(
+                "ABC123", TextContentRequest(title="Hello", message="World!")
+            )
+
+        assert response.success is True
+
+    @pytest.mark.asyncio
+    async def test_send_image_success(self, async_client, mock_response):
+        """Test successfully sending image content."""
+        mock_response.content = json.dumps(
+            {"code": 0, "message": "Image sent"}
+        ).encode()
+
+        with patch_request(async_client, mock_response):
+            response = await async_client.send_image(
+                "ABC123", ImageContentRequest(image="iVBORw0KGgoAAAANSUhEUgAA...")
+            )
+
+        assert response.success is True
+
+    @pytest.mark.asyncio
+    async def test_concurrent_status_requests(self, async_client, mock_response):
+        """Test device status requests can be gathered concurrently."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+
+        with patch_request(async_client, mock_response) as mock_request:
+            statuses = await asyncio.gather(
+                async_client.get_device_status("ABC123"),
+                async_client.get_device_status("DEF456"),
+            )
+
+        assert len(statuses) == 2
+        assert mock_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_status_poller(self, async_client, mock_response):
+        """Test the poller re-sends its pre-built request."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+        poll = async_client.prepare_status_poller("ABC123")
+
+        with patch.object(
+            async_client._client, "send", new=AsyncMock(return_value=mock_response)
+        ) as mock_send:
+            status = await poll()
+            await poll()
+
+        assert status.deviceId == "ABC123"
+        assert mock_send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_device_statuses(self, async_client, mock_response):
+        """Test batch status helper returns one status per device id."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+
+        with patch_request(async_client, mock_response) as mock_request:
+            statuses = await async_client.get_device_statuses(["ABC123", "DEF456"])
+
+        assert all(isinstance(s, DeviceStatus) for s in statuses)
+        assert mock_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_send_text_many(self, async_client, mock_response):
+        """Test texts for several devices are sent concurrently."""
+        mock_response.content = json.dumps({"code": 0, "message": "Text sent"}).encode()
+
+        with patch_request(async_client, mock_response) as mock_request:
+            responses = await async_client.send_text_many(
+                {
+                    "ABC123": TextContentRequest(message="one"),
+                    "DEF456": TextContentRequest(message="two"),
+                }
+            )
+
+        assert set(responses) == {"ABC123", "DEF456"}
+        assert all(r.success for r in responses.values())
+        assert mock_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_read_calls_overlap(self):
+        """Test gathered read calls are in flight together, writes follow."""
+        in_flight = 0
+        peak = 0
+        paths = []
+        bodies = {
+            "/api/authV2/open/devices": [],
+            "/api/authV2/open/device/ABC123/status": STATUS_DATA,
+            "/api/authV2/open/device/ABC123/loop/list": [],
+        }
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            paths.append(request.url.path)
+            body = bodies.get(request.url.path, {"code": 0, "message": "ok"})
+            return httpx.Response(200, json=body)
+
+        client = AsyncQuote0Client(
+            api_key="test-key", transport=httpx.MockTransport(handler)
+        )
+        devices, status, tasks = await asyncio.gather(
+            client.get_devices(),
+            client.get_device_status("ABC123"),
+            client.list_tasks("ABC123"),
+        )
+        assert peak == 3
+
+        await client.switch_to_next("ABC123")
+        await client.send_text("ABC123", TextContentRequest(message="Hi"))
+
+        assert (devices, tasks) == ([], [])
+        assert status.deviceId == "ABC123"
+        assert paths[-2:] == [
+            "/api/authV2/open/device/ABC123/next",
+            "/api/authV2/open/device/ABC123/text",
+        ]
+
+
+# ============================================================================
+# Test: Error Handling
+# ============================================================================
+
+
+class TestAsyncErrorHandling:
+    """Test cases for HTTP error code mapping in the async client."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "status_code,exc_type,fragment",
+        [
+            (401, AuthenticationError, "Invalid API key"),
+            (404, NotFoundError, "Device or resource not found"),
+            (429, RateLimitError, "Rate limit exceeded"),
+            (500, Quote0Error, "Server error: 500"),
+        ],
+    )
+    async def test_http_error_mapping(self, status_code, exc_type, fragment):
+        """Test HTTP error status codes map to SDK exceptions."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(status_code))
+        client = AsyncQuote0Client(api_key="test-api-key-12345", transport=transport)
+
+        with patch("quote0_client.async_client.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(exc_type) as exc_info:
+                await client.get_devices()
+
+        assert fragment in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retried(self, async_client, mock_response):
+        """Test a 429 is retried before succeeding."""
+        limited = Mock(status_code=429, headers={})
+        mock_response.content = b"[]"
+
+        with (
+            patch.object(
+                async_client._client,
+                "request",
+                new=AsyncMock(side_effect=[limited, mock_response]),
+            ) as mock_request,
+            patch(
+                "quote0_client.async_client.asyncio.sleep", new=AsyncMock()
+            ) as mock_sleep,
+        ):
+            assert await async_client.get_devices() == []
+
+        assert mock_request.await_count == 2
+        mock_sleep.assert_awaited_once()
+
+
+# ============================================================================
+# Test: Client Initialization
+# ============================================================================
+
+
+class TestAsyncClientInit:
+    """Test cases for AsyncQuote0Client initialization."""
+
+    def test_client_init_success(self):
+        """Test successful client initialization."""
+        client = AsyncQuote0Client(api_key="test-key")
+        assert client.api_key == "test-key"
+        assert client.base_url == "https://dot.mindreset.tech"
+
+    def test_client_init_empty_api_key(self):
+        """Test ValueError when api_key is empty."""
+        with pytest.raises(ValueError) as exc_info:
+            AsyncQuote0Client(api_key="")
+
+        assert "api_key cannot be empty" in str(exc_info.value)
+
+    def test_client_default_headers(self):
+        """Test auth and content-type headers are configured on the HTTP client."""
+        client = AsyncQuote0Client(api_key="test-key")
+        assert client._client.headers["Authorization"] == "Bearer test-key"
+        assert client._client.headers["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_client_async_context_manager(self):
+        """Test client can be used as async context manager."""
+        async with AsyncQuote0Client(api_key="test-key") as client:
+            assert client.api_key == "test-key"
+
+        assert client._client.is_closed
@@ -11,10 +11,20 @@ Test coverage:
 - Custom exception handling
 """
 
+import base64
+import json
+import re
+import subprocess
+import sys
+
+import httpx
 import pytest
 from unittest.mock import Mock, patch
+from pydantic import TypeAdapter
+from quote0_client._base import _list_adapter
 from quote0_client.client import Quote0Client
 from quote0_client.models import (
+    BatterySnapshot,
     Device,
     DeviceStatus,
     Task,
@@ -36,6 +46,41 @@ from quote0_client.exceptions import (
 )
 
 
+# Placeholder Base64 PNG payload shared by the image tests
+SAMPLE_IMAGE_B64 = "iVBORw0KGgoAAAANSUhEUgAA..."
+
+# Minimal device status payload shared by the status tests
+STATUS_DATA = {
+    "deviceId": "ABC123",
+    "status": {
+        "version": "1.0.0",
+        "current": "80%",
+        "description": "Good",
+        "battery": "80%",
+        "wifi": "Good",
+    },
+    "renderInfo": {
+        "last": "2025-02-02 12:00:00",
+        "current": {"rotated": False, "border": 0, "image": []},
+        "next": {
+            "battery": "2025-02-02 13:00:00",
+            "power": "2025-02-02 13:00:00",
+        },
+    },
+}
+
+# HTTP status code, expected exception and message fragment
+ERROR_MAP = [
+    (400, ValidationError, "Request validation failed"),
+    (401, AuthenticationError, "Invalid API key"),
+    (403, PermissionError, "Insufficient permissions"),
+    (404, NotFoundError, "Device or resource not found"),
+    (429, RateLimitError, "Rate limit exceeded"),
+    (500, Quote0Error, "Server error: 500"),
+    (503, Quote0Error, "Server error: 503"),
+]
+
+
 # ============================================================================
 # Fixtures
 # ============================================================================
@@ -54,7 +99,7 @@ def mock_response(status_code: int = 200, json_data: dict | list | None = None)
     """
     response = Mock()
     response.status_code = status_code
-    response.json.return_value = json_data if json_data is not None else {}
+    response.content = json.dumps(json_data if json_data is not None else {}).encode()
     return response
 
 
@@ -93,7 +138,7 @@ class TestGetDevices:
             },
         ]
 
-        mock_response.json.return_value = devices_data
+        mock_response.content = json.dumps(devices_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             devices = test_client.get_devices()
@@ -109,13 +154,27 @@ class TestGetDevices:
 
     def test_get_devices_empty_list(self, test_client, mock_response):
         """Test retrieving empty device list."""
-        mock_response.json.return_value = []
+        mock_response.content = json.dumps([]).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             devices = test_client.get_devices()
 
             assert len(devices) == 0
 
+    def test_get_devices_reuses_list_adapter(self, test_client, mock_response):
+        """Test the List[Device] TypeAdapter is built once and reused."""
+        mock_response.content = json.dumps([]).encode()
+        _list_adapter.cache_clear()
+
+        with (
+            patch.object(test_client._client, "request", return_value=mock_response),
+            patch("quote0_client._base.TypeAdapter", wraps=TypeAdapter) as adapter,
+        ):
+            test_client.get_devices()
+            test_client.get_devices()
+
+        adapter.assert_called_once()
+
     def test_get_devices_authentication_error(self, test_client, mock_response):
         """Test authentication error when getting devices."""
         mock_response.status_code = 401
@@ -172,7 +231,7 @@ class TestGetDeviceStatus:
             },
         }
 
-        mock_response.json.return_value = status_data
+        mock_response.content = json.dumps(status_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             status = test_client.get_device_status("ABC123")
@@ -216,7 +275,7 @@ class TestGetDeviceStatus:
             },
         }
 
-        mock_response.json.return_value = status_data
+        mock_response.content = json.dumps(status_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             status = test_client.get_device_status("DEF456")
@@ -240,6 +299,276 @@ class TestGetDeviceStatus:
             assert "Device or resource not found" in str(exc_info.value)
 
 
+# ============================================================================
+# Test: get_device_status_minimal()
+# ============================================================================
+
+
+class TestGetDeviceStatusMinimal:
+    """Test cases for get_device_status_minimal() method."""
+
+    def test_minimal_status_success(self, test_client, mock_response):
+        """Test battery and WiFi are extracted without the full model."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+
+        with patch.object(test_client._client, "request", return_value=mock_response):
+            snapshot = test_client.get_device_status_minimal("ABC123")
+
+        assert isinstance(snapshot, BatterySnapshot)
+        assert snapshot == ("ABC123", "80%", "Good")
+        assert snapshot.wifi == "Good"
+
+    def test_minimal_status_malformed_response(self, test_client, mock_response):
+        """Test a response without status fields raises Quote0Error."""
+        mock_response.content = json.dumps({"deviceId": "ABC123"}).encode()
+
+        with patch.object(test_client._client, "request", return_value=mock_response):
+            with pytest.raises(Quote0Error) as exc_info:
+                test_client.get_device_status_minimal("ABC123")
+
+        assert "Malformed device status response" in str(exc_info.value)
+
+
+# ============================================================================
+# Test: validate_responses=False
+# ============================================================================
+
+
+class TestUnvalidatedResponses:
+    """Test cases for building response models without validation."""
+
+    @pytest.fixture
+    def trusting_client(self):
+        """Create a client that skips response validation."""
+        return Quote0Client(api_key="test-api-key-12345", validate_responses=False)
+
+    def test_status_built_without_validation(self, trusting_client, mock_response):
+        """Test nested status models are constructed, not validated."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+
+        with (
+            patch.object(
+                trusting_client._client, "request", return_value=mock_response
+            ),
+            patch.object(DeviceStatus, "model_validate_json") as mock_validate,
+        ):
+            status = trusting_client.get_device_status("ABC123")
+
+        mock_validate.assert_not_called()
+        assert isinstance(status, DeviceStatus)
+        assert isinstance(status.status, BatteryStatus)
+        assert isinstance(status.renderInfo.current, CurrentRenderInfo)
+        assert status.renderInfo.next.power == "2025-02-02 13:00:00"
+
+    def test_lists_built_without_validation(self, trusting_client, mock_response):
+        """Test device and task lists are constructed from raw dicts."""
+        mock_response.content = json.dumps(
+            [{"series": "quote", "model": "quote_0", "edition": 1, "id": "ABC123"}]
+        ).encode()
+
+        with patch.object(
+            trusting_client._client, "request", return_value=mock_response
+        ):
+            devices = trusting_client.get_devices()
+
+        mock_response.content = json.dumps([{"type": "TEXT_API", "key": "k1"}]).encode()
+        with patch.object(
+            trusting_client._client, "request", return_value=mock_response
+        ):
+            tasks = trusting_client.list_tasks("ABC123")
+
+        assert isinstance(devices[0], Device) and devices[0].id == "ABC123"
+        assert isinstance(tasks[0], Task) and tasks[0].refreshNow is True
+
+
+# ============================================================================
+# Test: TTL cache
+# ============================================================================
+
+
+class TestResponseCache:
+    """Test cases for the opt-in ttl_ms cache on read methods."""
+
+    def test_status_cache_hit_within_ttl(self, test_client, mock_response):
+        """Test a second call within ttl_ms does not issue a request."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+
+        with patch.object(
+            test_client._client, "request", return_value=mock_response
+        ) as mock_request:
+            first = test_client.get_device_status("ABC123")
+            second = test_client.get_device_status("ABC123", ttl_ms=60_000)
+
+        assert second is first
+        assert mock_request.call_count == 1
+
+    def test_status_cache_disabled_by_default(self, test_client, mock_response):
+        """Test calls without ttl_ms always hit the API."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+
+        with patch.object(
+            test_client._client, "request", return_value=mock_response
+        ) as mock_request:
+            test_client.get_device_status("ABC123")
+            test_client.get_device_status("ABC123")
+
+        assert mock_request.call_count == 2
+
+    def test_status_cache_expires(self, test_client, mock_response):
+        """Test entries older than ttl_ms are refetched."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+
+        with patch.object(
+            test_client._client, "request", return_value=mock_response
+        ) as mock_request:
+            test_client.get_device_status("ABC123")
+            with patch("quote0_client._base.time.monotonic", return_value=1e9):
+                test_client.get_device_status("ABC123", ttl_ms=1000)
+
+        assert mock_request.call_count == 2
+
+    def test_status_cache_invalidated_by_send_text(self, test_client, mock_response):
+        """Test sending content drops the cached status of that device."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+
+        with patch.object(
+            test_client._client, "request", return_value=mock_response
+        ) as mock_request:
+            test_client.get_device_status("ABC123")
+            mock_response.content = json.dumps(
+                {"code": 0, "message": "Text sent"}
+            ).encode()
+            test_client.send_text("ABC123", TextContentRequest(title="Hi"))
+            mock_response.content = json.dumps(STATUS_DATA).encode()
+            test_client.get_device_status("ABC123", ttl_ms=60_000)
+
+        assert mock_request.call_count == 3
+
+    def test_devices_cache_hit_within_ttl(self, test_client, mock_response):
+        """Test get_devices reuses a fresh cached list."""
+        mock_response.content = json.dumps(
+            [{"series": "quote", "model": "quote_0", "edition": 1, "id": "ABC123"}]
+        ).encode()
+
+        with patch.object(
+            test_client._client, "request", return_value=mock_response
+        ) as mock_request:
+            test_client.get_devices()
+            devices = test_client.get_devices(ttl_ms=60_000)
+
+        assert devices[0].id == "ABC123"
+        assert mock_request.call_count == 1
+
+
+# ============================================================================
+# Test: prepare_status_poller()
+# ============================================================================
+
+
+class TestStatusPoller:
+    """Test cases for prepare_status_poller() method."""
+
+    def test_poller_reuses_prebuilt_request(self, test_client, mock_response):
+        """Test every poll sends the same pre-built request object."""
+        mock_response.content = json.dumps(STATUS_DATA).encode()
+        poll = test_client.prepare_status_poller("ABC123")
+
+        with patch.object(
+            test_client._client, "send", return_value=mock_response
+        ) as mock_send:
+            first = poll()
+            second = poll()
+
+        assert isinstance(first, DeviceStatus)
+        assert second.deviceId == "ABC123"
+        assert mock_send.call_count == 2
+        assert (
+            mock_send.call_args_list[0].args[0] is mock_send.call_args_list[1].args[0]
+        )
+        assert str(mock_send.call_args.args[0].url).endswith("/device/ABC123/status")
+
+    def test_poller_raises_on_error(self, test_client, mock_response):
+        """Test HTTP errors are mapped to SDK exceptions."""
+        mock_response.status_code = 404
+        poll = test_client.prepare_status_poller("ABC123")
+
+        with patch.object(test_client._client, "send", return_value=mock_response):
+            with pytest.raises(NotFoundError):
+                poll()
+
+
+# ============================================================================
+# Test: get_device_statuses()
+# ============================================================================
+
+
+class TestGetDeviceStatuses:
+    """Test cases for get_device_statuses() method."""
+
+    def test_get_device_statuses_preserves_order(self, test_client):
+        """Test statuses are returned in the order of the requested ids."""
+
+        def fake_status(device_id):
+            return Mock(spec=DeviceStatus, deviceId=device_id)
+
+        with patch.object(test_client, "get_device_status", side_effect=fake_status):
+            statuses = test_client.get_device_statuses(["ABC123", "DEF456", "GHI789"])
+
+        assert [s.deviceId for s in statuses] == ["ABC123", "DEF456", "GHI789"]
+
+    def test_get_device_statuses_empty(self, test_client):
+        """Test an empty id list returns without issuing requests."""
+        with patch.object(test_client._client, "request") as mock_request:
+            assert test_client.get_device_statuses([]) == []
+
+        mock_request.assert_not_called()
+
+    def test_get_device_statuses_propagates_errors(self, test_client, mock_response):
+        """Test an error for any device is raised to the caller."""
+        mock_response.status_code = 404
+
+        with patch.object(test_client._client, "request", return_value=mock_response):
+            with pytest.raises(NotFoundError):
+                test_client.get_device_statuses(["ABC123", "DEF456"])
+
+
+# ============================================================================
+# Test: send_text_many()
+# ============================================================================
+
+
+class TestSendTextMany:
+    """Test cases for send_text_many() method."""
+
+    def test_send_text_many_maps_results(self, test_client):
+        """Test each device id is mapped to its own response."""
+
+        def fake_send(device_id, content):
+            return APIResponse(code=0, message=f"{device_id}:{content.message}")
+
+        payloads = {
+            "ABC123": TextContentRequest(message="one"),
+            "DEF456": TextContentRequest(message="two"),
+        }
+        with patch.object(test_client, "send_text", side_effect=fake_send):
+            responses = test_client.send_text_many(payloads)
+
+        assert list(responses) == ["ABC123", "DEF456"]
+        assert responses["DEF456"].message == "DEF456:two"
+
+    def test_send_text_many_rejects_bad_id_before_sending(self, test_client):
+        """Test a malformed device id fails before any request is made."""
+        payloads = {
+            "ABC123": TextContentRequest(message="one"),
+            "bad id": TextContentRequest(message="two"),
+        }
+        with patch.object(test_client._client, "request") as mock_request:
+            with pytest.raises(ValidationError):
+                test_client.send_text_many(payloads)
+
+        mock_request.assert_not_called()
+
+
 # ============================================================================
 # Test: switch_to_next()
 # ============================================================================
@@ -252,7 +581,7 @@ class TestSwitchToNext:
         """Test successfully switching to next content."""
         response_data = {"code": 0, "message": "Switched successfully", "result": {}}
 
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             response = test_client.switch_to_next("ABC123")
@@ -266,7 +595,7 @@ class TestSwitchToNext:
         """Test server error response."""
         mock_response = Mock()
         mock_response.status_code = 500
-        mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             with pytest.raises(Quote0Error) as exc_info:
@@ -284,6 +613,32 @@ class TestSwitchToNext:
 
             assert "Device or resource not found" in str(exc_info.value)
 
+    def test_switch_to_next_without_parsing(self, test_client, mock_response):
+        """Test parse_response=False streams the call and skips the body."""
+        mock_response.is_stream_consumed = False
+        mock_response.iter_raw.return_value = iter([b'{"code": 0}'])
+        type(mock_response).content = property(
+            lambda self: pytest.fail("response body was decoded")
+        )
+
+        with patch.object(
+            test_client._client, "send", return_value=mock_response
+        ) as mock_send:
+            assert test_client.switch_to_next("ABC123", parse_response=False) is None
+
+        assert mock_send.call_args.kwargs == {"stream": True}
+        mock_response.close.assert_called_once()
+
+    def test_switch_to_next_without_parsing_raises(self, test_client, mock_response):
+        """Test error statuses are still raised when the body is skipped."""
+        mock_response.status_code = 404
+        mock_response.is_stream_consumed = False
+        mock_response.iter_raw.return_value = iter([])
+
+        with patch.object(test_client._client, "send", return_value=mock_response):
+            with pytest.raises(NotFoundError):
+                test_client.switch_to_next("ABC123", parse_response=False)
+
 
 # ============================================================================
 # Test: list_tasks()
@@ -312,7 +667,7 @@ class TestListTasks:
             },
         ]
 
-        mock_response.json.return_value = tasks_data
+        mock_response.content = json.dumps(tasks_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             tasks = test_client.list_tasks("ABC123")
@@ -335,7 +690,7 @@ class TestListTasks:
             }
         ]
 
-        mock_response.json.return_value = tasks_data
+        mock_response.content = json.dumps(tasks_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             tasks = test_client.list_tasks("ABC123")
@@ -361,6 +716,71 @@ class TestListTasks:
 
             assert "Insufficient permissions" in str(exc_info.value)
 
+    def test_list_tasks_reuses_unchanged_tasks(self, mock_response):
+        """Test reuse_tasks skips parsing while the task list is unchanged."""
+        client = Quote0Client(api_key="test-key", reuse_tasks=True)
+        mock_response.content = json.dumps([{"type": "TEXT_API", "key": "k1"}]).encode()
+
+        with (
+            patch.object(client._client, "request", return_value=mock_response),
+            patch.object(
+                client, "_parse_tasks", wraps=client._parse_tasks
+            ) as mock_parse,
+        ):
+            first = client.list_tasks("ABC123")
+            second = client.list_tasks("ABC123")
+            mock_response.content = json.dumps(
+                [{"type": "TEXT_API", "key": "k2"}]
+            ).encode()
+            third = client.list_tasks("ABC123")
+
+        assert mock_parse.call_count == 2
+        assert first == second
+        assert first[0] is not second[0]
+        assert third[0].key == "k2"
+
+    def test_list_tasks_no_reuse_by_default(self, test_client, mock_response):
+        """Test tasks are parsed afresh and nothing is retained by default."""
+        mock_response.content = json.dumps([{"type": "TEXT_API", "key": "k1"}]).encode()
+
+        with patch.object(test_client._client, "request", return_value=mock_response):
+            first = test_client.list_tasks("ABC123")
+            second = test_client.list_tasks("ABC123")
+
+        assert first[0] is not second[0]
+        assert test_client._tasks_cache == {}
+
+    def test_list_tasks_caller_mutation_does_not_leak(self, mock_response):
+        """Test a caller cannot change the tasks returned by the next poll."""
+        client = Quote0Client(api_key="test-key", reuse_tasks=True)
+        mock_response.content = json.dumps(
+            [{"type": "TEXT_API", "key": "k1", "title": "original"}]
+        ).encode()
+
+        with patch.object(client._client, "request", return_value=mock_response):
+            tasks = client.list_tasks("ABC123")
+            tasks[0].title = "edited"
+            tasks.clear()
+            again = client.list_tasks("ABC123")
+
+        assert [t.title for t in again] == ["original"]
+
+    def test_list_tasks_extended_task_types(self, mock_response):
+        """Test subclasses can accept more task types via _VALID_TASK_TYPES."""
+
+        class ExtendedClient(Quote0Client):
+            _VALID_TASK_TYPES = frozenset({"loop", "fixed"})
+
+        client = ExtendedClient(api_key="test-key")
+        mock_response.content = json.dumps([]).encode()
+
+        with patch.object(
+            client._client, "request", return_value=mock_response
+        ) as mock_request:
+            assert client.list_tasks("ABC123", task_type="fixed") == []
+
+        assert mock_request.call_args.args[1].endswith("/ABC123/fixed/list")
+
 
 # ============================================================================
 # Test: send_text()
@@ -376,7 +796,7 @@ class TestSendText:
 
         response_data = {"code": 0, "message": "Text sent", "result": {}}
 
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             response = test_client.send_text("ABC123", text_req)
@@ -393,7 +813,7 @@ class TestSendText:
 
         response_data = {"code": 0, "message": "Success", "result": {}}
 
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             response = test_client.send_text("ABC123", text_req)
@@ -411,13 +831,31 @@ class TestSendText:
 
         response_data = {"code": 0, "message": "Success", "result": {}}
 
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             response = test_client.send_text("ABC123", text_req)
 
             assert response.success is True
 
+    def test_send_text_request_body(self, test_client, mock_response):
+        """Test the request body is pre-serialized JSON without null fields."""
+        text_req = TextContentRequest(title="Hello", message="World!", refreshNow=False)
+        mock_response.content = json.dumps({"code": 0, "message": "Success"}).encode()
+
+        with patch.object(
+            test_client._client, "request", return_value=mock_response
+        ) as mock_request:
+            test_client.send_text("ABC123", text_req)
+
+        body = mock_request.call_args.kwargs["content"]
+        assert isinstance(body, bytes)
+        assert json.loads(body) == {
+            "refreshNow": False,
+            "title": "Hello",
+            "message": "World!",
+        }
+
     def test_send_text_validation_error(self, test_client, mock_response):
         """Test validation error when sending text."""
         mock_response.status_code = 400
@@ -450,12 +888,12 @@ class TestSendImage:
     def test_send_image_success(self, test_client, mock_response):
         """Test successfully sending image content."""
         image_req = ImageContentRequest(
-            image="iVBORw0KGgoAAAANSUhEUgAA...", border=0, refreshNow=True
+            image=SAMPLE_IMAGE_B64, border=0, refreshNow=True
         )
 
         response_data = {"code": 0, "message": "Image sent", "result": {}}
 
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             response = test_client.send_image("ABC123", image_req)
@@ -464,10 +902,26 @@ class TestSendImage:
             assert response.code == 0
             assert response.success is True
 
+    def test_send_image_request_body(self, test_client, mock_response):
+        """Test the image body keeps falsy values but omits unset optionals."""
+        image_req = ImageContentRequest(image=SAMPLE_IMAGE_B64, refreshNow=False)
+        mock_response.content = json.dumps({"code": 0, "message": "Success"}).encode()
+
+        with patch.object(
+            test_client._client, "request", return_value=mock_response
+        ) as mock_request:
+            test_client.send_image("ABC123", image_req)
+
+        body = mock_request.call_args.kwargs["content"]
+        assert b'"refreshNow":false' in body
+        assert b'"border":0' in body
+        assert b"null" not in body
+        assert b"link" not in body and b"taskKey" not in body
+
     def test_send_image_with_all_options(self, test_client, mock_response):
         """Test sending image with all options."""
         image_req = ImageContentRequest(
-            image="iVBORw0KGgoAAAANSUhEUgAA...",
+            image=SAMPLE_IMAGE_B64,
             border=1,
             ditherType="ORDERED",
             ditherKernel="ATKINSON",
@@ -476,7 +930,7 @@ class TestSendImage:
 
         response_data = {"code": 0, "message": "Success", "result": {}}
 
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             response = test_client.send_image("ABC123", image_req)
@@ -488,10 +942,10 @@ class TestSendImage:
     def test_send_image_validation_error(self, test_client):
         """Test validation error when sending image."""
         # Create a valid request first
-        image_req = ImageContentRequest(image="iVBORw0KGgoAAAANSUhEUgAA...", border=0)
+        image_req = ImageContentRequest(image=SAMPLE_IMAGE_B64, border=0)
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             with pytest.raises(ValidationError) as exc_info:
@@ -502,10 +956,10 @@ class TestSendImage:
     def test_send_image_permission_error(self, test_client):
         """Test permission error when sending image."""
         # Create a valid request first
-        image_req = ImageContentRequest(image="iVBORw0KGgoAAAANSUhEUgAA...", border=0)
+        image_req = ImageContentRequest(image=SAMPLE_IMAGE_B64, border=0)
         mock_response = Mock()
         mock_response.status_code = 403
-        mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             with pytest.raises(PermissionError) as exc_info:
@@ -514,6 +968,59 @@ class TestSendImage:
             assert "Insufficient permissions" in str(exc_info.value)
 
 
+# ============================================================================
+# Test: send_image_from_path()
+# ============================================================================
+
+
+class TestSendImageFromPath:
+    """Test cases for send_image_from_path() method."""
+
+    def test_send_image_from_path_encodes_file(
+        self, test_client, mock_response, tmp_path
+    ):
+        """Test the file is Base64-encoded into the request body."""
+        image_path = tmp_path / "image.png"
+        image_path.write_bytes(b"\x89PNG fake image bytes")
+        mock_response.content = json.dumps(
+            {"code": 0, "message": "Image sent"}
+        ).encode()
+
+        with patch.object(
+            test_client._client, "request", return_value=mock_response
+        ) as mock_request:
+            response = test_client.send_image_from_path("ABC123", image_path, border=1)
+
+        body = json.loads(mock_request.call_args.kwargs["content"])
+        assert response.success is True
+        assert base64.b64decode(body["image"]) == b"\x89PNG fake image bytes"
+        assert body["border"] == 1
+
+    def test_image_request_from_png_bytes(self):
+        """Test from_png_bytes Base64-encodes raw PNG bytes."""
+        request = ImageContentRequest.from_png_bytes(b"\x89PNG raw", border=1)
+
+        assert request.image == base64.b64encode(b"\x89PNG raw").decode("ascii")
+        assert request.border == 1
+        assert ImageContentRequest(image="abc=").image == "abc="
+
+    def test_image_request_keeps_base64_bytes(self):
+        """Test Base64 passed as bytes is stored as-is, not re-encoded."""
+        encoded = base64.b64encode(b"\x89PNG\r\n\x1a\nabc")
+
+        request = ImageContentRequest(image=encoded)
+
+        assert request.image == encoded.decode("ascii")
+
+    def test_send_image_from_path_missing_file(self, test_client, tmp_path):
+        """Test a missing file raises before any request is made."""
+        with patch.object(test_client._client, "request") as mock_request:
+            with pytest.raises(FileNotFoundError):
+                test_client.send_image_from_path("ABC123", tmp_path / "missing.png")
+
+        mock_request.assert_not_called()
+
+
 # ============================================================================
 # Test: Client Initialization
 # ============================================================================
@@ -561,6 +1068,159 @@ class TestClientInit:
 
         # Client should be closed after context exit
 
+    def test_client_default_headers(self):
+        """Test auth and content-type headers are configured on the HTTP client."""
+        client = Quote0Client(api_key="test-key")
+        assert client._client.headers["Authorization"] == "Bearer test-key"
+        assert client._client.headers["Content-Type"] == "application/json"
+        assert client._client.headers["Accept-Encoding"] == "gzip, br"
+
+    def test_clients_share_connection_pool(self):
+        """Test clients with the same base URL reuse one transport."""
+        first = Quote0Client(api_key="key-one")
+        second = Quote0Client(api_key="key-two")
+        other = Quote0Client(api_key="key-one", base_url="https://custom.api.com")
+
+        assert (
+            first._client._transport._transport is second._client._transport._transport
+        )
+        assert (
+            other._client._transport._transport
+            is not first._client._transport._transport
+        )
+
+    def test_close_keeps_shared_pool_open(self):
+        """Test closing one client does not close the shared transport."""
+        client = Quote0Client(api_key="test-key")
+        shared = client._client._transport._transport
+
+        with patch.object(shared, "close") as mock_close:
+            client.close()
+
+        assert client._client.is_closed
+        mock_close.assert_not_called()
+
+    def test_shared_pool_is_per_process(self):
+        """Test a forked child does not reuse the parent's connection pool."""
+        with patch.dict(Quote0Client._SHARED_TRANSPORTS, clear=True):
+            parent = Quote0Client(api_key="test-key")
+            with patch("quote0_client.client.os.getpid", return_value=-1):
+                child = Quote0Client(api_key="test-key")
+
+        assert (
+            child._client._transport._transport
+            is not parent._client._transport._transport
+        )
+
+    def test_close_shared_transports(self):
+        """Test shared pools of this process are closed and forgotten."""
+        with patch.dict(Quote0Client._SHARED_TRANSPORTS, clear=True):
+            client = Quote0Client(api_key="test-key")
+            shared = client._client._transport._transport
+            inherited = Mock()
+            Quote0Client._SHARED_TRANSPORTS[(-1, client.base_url)] = inherited
+
+            with patch.object(shared, "close") as mock_close:
+                client.close()
+                Quote0Client.close_shared_transports()
+
+            assert Quote0Client._SHARED_TRANSPORTS == {}
+            mock_close.assert_called_once()
+            inherited.close.assert_not_called()
+
+    def test_shared_transport_ignores_environment(self):
+        """Test the shared transport is built with trust_env disabled."""
+        with (
+            patch.dict(Quote0Client._SHARED_TRANSPORTS, clear=True),
+            patch(
+                "quote0_client.client.httpx.HTTPTransport",
+                wraps=httpx.HTTPTransport,
+            ) as mock_transport,
+        ):
+            Quote0Client(api_key="test-key").close()
+
+        assert mock_transport.call_args.kwargs["trust_env"] is False
+
+    def test_package_import_is_lazy(self):
+        """Test importing the package does not load httpx or pydantic."""
+        code = (
+            "import sys, quote0_client; "
+            "assert 'httpx' not in sys.modules; "
+            "assert 'pydantic' not in sys.modules; "
+            "assert quote0_client.Quote0Client.__name__ == 'Quote0Client'"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_model_validators_built_lazily(self):
+        """Test creating a client does not build model validators up front."""
+        code = (
+            "from quote0_client import Quote0Client, Device; "
+            "Quote0Client(api_key='test-key'); "
+            "assert not Device.__pydantic_complete__"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_request_does_not_pass_per_call_headers(self, test_client, mock_response):
+        """Test requests rely on client-level headers instead of per-call ones."""
+        mock_response.content = json.dumps([]).encode()
+
+        with patch.object(
+            test_client._client, "request", return_value=mock_response
+        ) as mock_request:
+            test_client.get_devices()
+
+        mock_request.assert_called_once_with(
+            "GET", "https://dot.mindreset.tech/api/authV2/open/devices"
+        )
+
+
+# ============================================================================
+# Test: device_id validation
+# ============================================================================
+
+
+class TestDeviceIdValidation:
+    """Test cases for client-side device_id validation."""
+
+    @pytest.mark.parametrize("device_id", ["", "abc", "ABC 123", "ABC/123", "ABC123\n"])
+    def test_malformed_device_id_rejected_locally(self, test_client, device_id):
+        """Test malformed ids raise ValidationError without a request."""
+        with patch.object(test_client._client, "request") as mock_request:
+            with pytest.raises(ValidationError) as exc_info:
+                test_client.get_device_status(device_id)
+
+        assert "Invalid device_id" in str(exc_info.value)
+        mock_request.assert_not_called()
+
+    def test_device_id_checked_by_all_device_methods(self, test_client):
+        """Test every device-scoped method validates the id."""
+        calls = [
+            lambda: test_client.switch_to_next("bad id"),
+            lambda: test_client.list_tasks("bad id"),
+            lambda: test_client.send_text("bad id", TextContentRequest()),
+            lambda: test_client.send_image("bad id", ImageContentRequest(image="x")),
+            lambda: test_client.get_device_statuses(["ABC123", "bad id"]),
+        ]
+
+        with patch.object(test_client._client, "request") as mock_request:
+            for call in calls:
+                with pytest.raises(ValidationError):
+                    call()
+
+        mock_request.assert_not_called()
+
+    def test_device_id_pattern_overridable(self, mock_response):
+        """Test subclasses can accept a different serial number format."""
+
+        class ShortIdClient(Quote0Client):
+            DEVICE_ID_PATTERN = re.compile(r"[0-9]{3}")
+
+        client = ShortIdClient(api_key="test-key")
+        mock_response.content = json.dumps({"code": 0, "message": "ok"}).encode()
+
+        with patch.object(client._client, "request", return_value=mock_response):
+            assert client.switch_to_next("123").success is True
+
 
 # ============================================================================
 # Test: Error Handling
@@ -570,90 +1230,171 @@ class TestClientInit:
 class TestErrorHandling:
     """Test cases for HTTP error code mapping."""
 
-    def test_http_400_validation_error(self, test_client):
-        """Test HTTP 400 maps to ValidationError."""
-        with patch.object(test_client._client, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 400
-            mock_response.json.return_value = {"error": "Bad request"}
-            mock_request.return_value = mock_response
+    @pytest.mark.parametrize("status_code,exc_type,fragment", ERROR_MAP)
+    def test_http_error_mapping(self, monkeypatch, status_code, exc_type, fragment):
+        """Test HTTP error status codes map to SDK exceptions."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(status_code))
+        client = Quote0Client(api_key="test-api-key-12345", transport=transport)
+        monkeypatch.setattr("quote0_client.client.time.sleep", lambda _: None)
 
-            with pytest.raises(ValidationError) as exc_info:
-                test_client.get_devices()
+        with pytest.raises(exc_type) as exc_info:
+            client.get_devices()
 
-            assert "Request validation failed" in str(exc_info.value)
+        # The message is stored verbatim as the exception's only argument
+        (message,) = exc_info.value.args
+        assert fragment in message
 
-    def test_http_401_authentication_error(self, test_client):
-        """Test HTTP 401 maps to AuthenticationError."""
-        with patch.object(test_client._client, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 401
-            mock_request.return_value = mock_response
+    def test_mock_transport_round_trip(self):
+        """Test a custom transport receives the authenticated request."""
+        seen = []
 
-            with pytest.raises(AuthenticationError) as exc_info:
-                test_client.get_devices()
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"code": 0, "message": "Switched"})
 
-            assert "Invalid API key" in str(exc_info.value)
+        client = Quote0Client(
+            api_key="test-key", transport=httpx.MockTransport(handler)
+        )
+        response = client.switch_to_next("ABC123")
 
-    def test_http_403_permission_error(self, test_client):
-        """Test HTTP 403 maps to PermissionError."""
-        with patch.object(test_client._client, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 403
-            mock_request.return_value = mock_response
+        assert response.success is True
+        assert seen[0].headers["Authorization"] == "Bearer test-key"
+        assert seen[0].url.path == "/api/authV2/open/device/ABC123/next"
 
-            with pytest.raises(PermissionError) as exc_info:
-                test_client.get_devices()
+    def test_mock_transport_switch_without_parsing(self):
+        """Test parse_response=False works when the body was already read."""
+        seen = []
 
-            assert "Insufficient permissions" in str(exc_info.value)
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"code": 0, "message": "Switched"})
 
-    def test_http_404_not_found_error(self, test_client):
-        """Test HTTP 404 maps to NotFoundError."""
-        with patch.object(test_client._client, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 404
-            mock_request.return_value = mock_response
+        client = Quote0Client(
+            api_key="test-key", transport=httpx.MockTransport(handler)
+        )
 
-            with pytest.raises(NotFoundError) as exc_info:
+        assert client.switch_to_next("ABC123", parse_response=False) is None
+        assert seen[0].url.path == "/api/authV2/open/device/ABC123/next"
+
+    def test_unexpected_status_code(self, test_client, mock_response):
+        """Test unmapped non-5xx status codes raise Quote0Error."""
+        mock_response.status_code = 418
+
+        with patch.object(test_client._client, "request", return_value=mock_response):
+            with pytest.raises(Quote0Error) as exc_info:
                 test_client.get_devices()
 
-            assert "Device or resource not found" in str(exc_info.value)
+        assert "Unexpected status code: 418" in str(exc_info.value)
+
+
+# ============================================================================
+# Test: Rate-limit retries
+# ============================================================================
 
-    def test_http_429_rate_limit_error(self, test_client):
-        """Test HTTP 429 maps to RateLimitError."""
-        with patch.object(test_client._client, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 429
-            mock_request.return_value = mock_response
 
-            with pytest.raises(RateLimitError) as exc_info:
+class TestRateLimitRetry:
+    """Test cases for automatic retries of 429 responses."""
+
+    @staticmethod
+    def make_response(status_code: int, headers: dict | None = None) -> Mock:
+        """Create a mock response with the given status and headers."""
+        response = Mock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.content = b"[]"
+        return response
+
+    def test_retries_until_success(self, test_client):
+        """Test a 429 followed by 200 returns the successful response."""
+        responses = [self.make_response(429), self.make_response(200)]
+
+        with (
+            patch.object(
+                test_client._client, "request", side_effect=responses
+            ) as mock_request,
+            patch("quote0_client.client.time.sleep") as mock_sleep,
+        ):
+            assert test_client.get_devices() == []
+
+        assert mock_request.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_gives_up_after_max_retries(self, test_client):
+        """Test RateLimitError is raised once retries are exhausted."""
+        with (
+            patch.object(
+                test_client._client, "request", return_value=self.make_response(429)
+            ) as mock_request,
+            patch("quote0_client.client.time.sleep") as mock_sleep,
+        ):
+            with pytest.raises(RateLimitError):
                 test_client.get_devices()
 
-            assert "Rate limit exceeded" in str(exc_info.value)
+        assert mock_request.call_count == test_client.max_retries + 1
+        assert mock_sleep.call_count == test_client.max_retries
 
-    def test_http_500_quote0_error(self, test_client):
-        """Test HTTP 500 maps to Quote0Error."""
-        with patch.object(test_client._client, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 500
-            mock_request.return_value = mock_response
+    def test_backoff_grows_and_is_capped(self, test_client):
+        """Test delays double per attempt and never exceed two seconds."""
+        response = self.make_response(429)
+        delays = [test_client._retry_delay(attempt, response) for attempt in range(6)]
 
-            with pytest.raises(Quote0Error) as exc_info:
+        assert 0.1 <= delays[0] < 0.2
+        assert 0.2 <= delays[1] < 0.3
+        assert max(delays) <= 2.0
+
+    def test_retry_after_header_respected(self, test_client):
+        """Test a numeric Retry-After header sets the delay."""
+        responses = [
+            self.make_response(429, {"Retry-After": "1.5"}),
+            self.make_response(200),
+        ]
+
+        with (
+            patch.object(test_client._client, "request", side_effect=responses),
+            patch("quote0_client.client.time.sleep") as mock_sleep,
+        ):
+            test_client.get_devices()
+
+        mock_sleep.assert_called_once_with(1.5)
+
+    def test_long_retry_after_raises(self, test_client):
+        """Test a Retry-After above MAX_RETRY_DELAY fails instead of sleeping."""
+        limited = self.make_response(429, {"Retry-After": "3600"})
+
+        with (
+            patch.object(
+                test_client._client, "request", return_value=limited
+            ) as mock_request,
+            patch("quote0_client.client.time.sleep") as mock_sleep,
+        ):
+            with pytest.raises(RateLimitError):
                 test_client.get_devices()
 
-            assert "Server error: 500" in str(exc_info.value)
+        assert mock_request.call_count == 1
+        mock_sleep.assert_not_called()
 
-    def test_http_503_quote0_error(self, test_client):
-        """Test HTTP 503 maps to Quote0Error."""
-        with patch.object(test_client._client, "request") as mock_request:
-            mock_response = Mock()
-            mock_response.status_code = 503
-            mock_request.return_value = mock_response
+    def test_negative_max_retries_rejected(self):
+        """Test a negative max_retries is rejected at construction."""
+        with pytest.raises(ValueError) as exc_info:
+            Quote0Client(api_key="test-key", max_retries=-1)
 
-            with pytest.raises(Quote0Error) as exc_info:
-                test_client.get_devices()
+        assert "max_retries cannot be negative" in str(exc_info.value)
+
+    def test_retries_disabled(self):
+        """Test max_retries=0 raises on the first 429."""
+        client = Quote0Client(api_key="test-key", max_retries=0)
 
-            assert "Server error: 503" in str(exc_info.value)
+        with (
+            patch.object(
+                client._client, "request", return_value=self.make_response(429)
+            ) as mock_request,
+            patch("quote0_client.client.time.sleep") as mock_sleep,
+        ):
+            with pytest.raises(RateLimitError):
+                client.get_devices()
+
+        assert mock_request.call_count == 1
+        mock_sleep.assert_not_called()
 
 
 # ============================================================================
@@ -675,24 +1416,20 @@ class TestModelSerialization:
             }
         ]
 
-        mock_response.json.return_value = devices_data
+        mock_response.content = json.dumps(devices_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             devices = test_client.get_devices()
             device = devices[0]
 
             # Test model_dump() returns original data
-            dumped = device.model_dump()
-            assert dumped["series"] == "quote"
-            assert dumped["model"] == "quote_0"
-            assert dumped["edition"] == 1
-            assert dumped["id"] == "TEST123"
+            assert device.model_dump() == devices_data[0]
 
     def test_api_response_success_property(self, test_client, mock_response):
         """Test APIResponse success property."""
         response_data = {"code": 0, "message": "Success", "result": {}}
 
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             response = test_client.switch_to_next("ABC123")
@@ -704,10 +1441,38 @@ class TestModelSerialization:
         """Test APIResponse success property when code is non-zero."""
         response_data = {"code": 1, "message": "Error", "result": {}}
 
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
 
         with patch.object(test_client._client, "request", return_value=mock_response):
             response = test_client.switch_to_next("ABC123")
 
             assert response.success is False
             assert response.code == 1
+
+    def test_api_response_string_code_coerced(self, test_client, mock_response):
+        """Test a numeric string code is coerced so success still works."""
+        mock_response.content = json.dumps({"code": "0", "message": "Success"}).encode()
+
+        with patch.object(test_client._client, "request", return_value=mock_response):
+            response = test_client.switch_to_next("ABC123")
+
+        assert response.code == 0
+        assert response.success is True
+
+    def test_api_response_success_follows_code(self):
+        """Test success reflects the current code after copies and edits."""
+        response = APIResponse(code=0, message="Success")
+        assert response.success is True
+
+        assert response.model_copy(update={"code": 1}).success is False
+        response.code = 5
+        assert response.success is False
+        assert "success" not in response.model_dump()
+
+    def test_api_response_equality_after_success_read(self):
+        """Test reading success does not affect model equality."""
+        first = APIResponse(code=0, message="Success")
+        second = APIResponse(code=0, message="Success")
+
+        assert first.success is True
+        assert first == second